@@ -2,7 +2,8 @@
 File API endpoints (v1) - Controller Layer
 app/api/v1/files.py
 """
-from fastapi import APIRouter, Request, Depends, UploadFile, File, Query, status
+import os
+from fastapi import APIRouter, Request, Depends, UploadFile, File, HTTPException, Query, status
 from fastapi.responses import FileResponse
 from typing import Optional
 from app.schemas.file import (
@@ -201,8 +202,16 @@ async def download_file(
     file_path, original_filename = await file_service.download_file(file_id, current_user)
 
     # 파일 응답 반환
+    # stat 결과를 FileResponse에 전달하여 stat 호출을 1회로 줄이고,
+    # 디스크에 파일이 없는 경우만 404로 변환
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
     return FileResponse(
         path=str(file_path),
+        stat_result=stat_result,
         filename=original_filename,
         media_type='application/octet-stream'
     )
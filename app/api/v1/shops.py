@@ -50,14 +50,19 @@ async def get_shops(
         total_pages=math.ceil(total / page_size) if total > 0 else 0
     )
 
-@router.get("/my", response_model=list[ShopResponse])
+@router.get("/my", response_model=MyShopListResponse)
 async def get_my_shops(
+        after_shop_no: Optional[int] = Query(None, ge=1),
+        limit: int = Query(50, ge=1, le=100),
         current_user: UserEntity = Depends(get_current_user),
         shop_service: ShopService = Depends(get_shop_service)
 ):
-    """내 상점 목록 조회 (인증 필요)"""
-    shops = await shop_service.get_my_shops(current_user)
-    return [ShopResponse.model_validate(shop) for shop in shops]
+    """내 상점 목록 조회 (인증 필요, 커서 페이징)"""
+    shops, next_cursor = await shop_service.get_my_shops(current_user, after_shop_no, limit)
+    return MyShopListResponse(
+        shops=[ShopResponse.model_validate(shop) for shop in shops],
+        next_cursor=next_cursor
+    )
 
 @router.get("/code/{shop_code}", response_model=ShopResponse)
 async def get_shop_by_code(
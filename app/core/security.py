@@ -1,12 +1,25 @@
 import bcrypt
+import hashlib
 import secrets
-import string
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from app.core.config import settings
 
 
+# 검증된 토큰 payload 캐시 설정 (프로세스 로컬)
+# 같은 토큰이 요청마다 서명 검증을 반복하는 것을 줄입니다.
+# 키는 원문 토큰이 아닌 sha256 다이제스트 — 캐시 덤프로 토큰이 새지 않도록.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 10.0
+
+# sha256(token) -> (만료 시각(monotonic), payload)
+# TTL이 토큰 exp에 따라 달라지므로 저장 시각 대신 만료 시각을 기록합니다.
+_token_cache: OrderedDict[bytes, tuple] = OrderedDict()
+
+
 def hash_password(password: str) -> str:
     """
     비밀번호 해싱 (bcrypt)
@@ -67,12 +80,11 @@ def generate_random_password(length: int = 8) -> str:
         생성된 랜덤 비밀번호
 
     Example:
-        password = generate_random_password(8)  # "Xy3$kL9p"
+        password = generate_random_password(8)  # "Xy3kL9p_"
     """
-    # 대문자, 소문자, 숫자 조합
-    alphabet = string.ascii_letters + string.digits
-    password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    return password
+    # token_urlsafe는 os.urandom 호출 한 번으로 전체 문자를 생성하므로
+    # 문자 단위 secrets.choice 루프보다 빠릅니다 (영숫자 + '-', '_')
+    return secrets.token_urlsafe(length)[:length]
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -108,18 +120,41 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     JWT Access Token 디코딩
 
+    검증에 성공한 payload는 최대 10초(토큰 만료가 더 빠르면 그때까지)
+    캐시되어 같은 토큰의 연속 요청이 서명 검증을 반복하지 않습니다.
+    유효하지 않은 토큰은 캐시를 거치지 않고 항상 None을 반환합니다.
+
     Args:
         token: JWT 토큰 문자열
 
     Returns:
         토큰에 포함된 데이터 또는 None (유효하지 않은 경우)
     """
+    key = hashlib.sha256(token.encode('utf-8')).digest()
+    entry = _token_cache.get(key)
+    if entry is not None:
+        expires_at, payload = entry
+        if time.monotonic() < expires_at:
+            _token_cache.move_to_end(key)
+            return payload
+        del _token_cache[key]
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+    # 토큰 만료(exp)를 넘겨서 캐시가 유효 판정을 내리지 않도록 TTL을 자름
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get('exp')
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache[key] = (time.monotonic() + ttl, payload)
+        if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
\ No newline at end of file
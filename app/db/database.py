@@ -4,9 +4,66 @@ app/db/database.py
 """
 
 import aiomysql
+import asyncio
+import contextvars
+import re
+from contextlib import asynccontextmanager
 from typing import Dict, List, Any, Optional
 from app.core.config import settings
 
+# transaction() 범위 안에서 공유되는 연결
+# (범위 밖에서는 None이며, 각 쿼리가 독립적으로 연결을 생성/커밋합니다)
+_current_connection: contextvars.ContextVar[Optional["aiomysql.Connection"]] = \
+    contextvars.ContextVar("db_transaction_connection", default=None)
+
+
+def get_transaction_connection() -> Optional["aiomysql.Connection"]:
+    """현재 transaction() 범위의 공유 연결 반환 (없으면 None)"""
+    return _current_connection.get()
+
+
+def get_transaction_lock(conn) -> asyncio.Lock:
+    """
+    공유 연결의 직렬화 Lock 반환 (연결 객체에 부착, 연결당 1개)
+
+    aiomysql 연결은 동시 쿼리를 지원하지 않으므로 (프로토콜 쓰기가
+    끼어들면 packet sequence 오류), transaction() 범위 안에서
+    asyncio.gather 등으로 동시에 실행되는 쿼리는 이 Lock으로
+    한 번에 하나씩 직렬화해야 합니다.
+    """
+    lock = getattr(conn, '_tx_lock', None)
+    if lock is None:
+        lock = conn._tx_lock = asyncio.Lock()
+    return lock
+
+
+@asynccontextmanager
+async def transaction():
+    """
+    하나의 연결/트랜잭션을 공유하는 범위를 연다
+
+    범위 안에서 실행되는 repository 호출(BaseRepository._execute 등)은
+    새 연결을 만들지 않고 이 연결을 재사용하며,
+    COMMIT은 범위가 정상 종료될 때 1회만 수행된다 (실패 시 전체 ROLLBACK).
+
+    Example:
+        async with transaction():
+            await repo_a.create(...)
+            await repo_b.delete(...)
+    """
+    conn = await get_db_connection()
+    token = _current_connection.set(conn)
+    try:
+        yield conn
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+    finally:
+        _current_connection.reset(token)
+        conn.close()
+
+
 async def get_db_connection():
     """
     데이터베이스 연결 생성
@@ -168,6 +225,141 @@ async def execute_many(query: str, params_list: List[tuple]) -> int:
         conn.close()
 
 
+# 이름 -> SQL 등록부 (서버측 prepared statement용, placeholder는 MySQL 문법대로 ?)
+_PREPARED_STATEMENTS: Dict[str, str] = {}
+
+
+def prepare(name: str, sql: str) -> None:
+    """
+    반복 실행할 쿼리를 이름으로 등록
+
+    서버측 PREPARE는 연결 단위이므로 등록만 해 두고,
+    실제 PREPARE는 execute_prepared가 연결별 최초 실행 시 수행합니다.
+
+    Args:
+        name: 문장 이름 (식별자만 허용)
+        sql: SQL (placeholder는 ? 사용)
+    """
+    if not name.isidentifier():
+        raise ValueError(f"prepared statement 이름이 올바르지 않습니다: {name}")
+    _PREPARED_STATEMENTS[name] = sql
+
+
+async def execute_prepared(name: str, params: tuple = ()):
+    """
+    등록된 쿼리를 서버측 prepared statement로 실행
+
+    transaction() 범위의 공유 연결에서 호출하면 연결당 1회만 PREPARE하고
+    이후에는 EXECUTE만 전송해 서버측 SQL 재파싱을 피합니다.
+    공유 연결이 없으면 PREPARE가 연결과 함께 버려져 이득이 없으므로
+    %s 플레이스홀더 일반 실행으로 폴백합니다.
+
+    Returns:
+        결과 집합이 있으면 list[dict], DML이면 INSERT ID 또는 영향받은 행 수
+    """
+    sql = _PREPARED_STATEMENTS[name]
+    conn = get_transaction_connection()
+
+    if conn is None:
+        # 호출마다 새 연결이면 서버측 PREPARE는 순수 낭비 — 일반 실행
+        fallback_conn = await get_db_connection()
+        try:
+            async with fallback_conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(sql.replace('?', '%s'), params)
+                if cursor.description:
+                    return await cursor.fetchall()
+                await fallback_conn.commit()
+                return cursor.lastrowid or cursor.rowcount
+        finally:
+            fallback_conn.close()
+
+    # 공유 연결에 이미 PREPARE된 문장 이름 집합 (연결 객체에 부착)
+    prepared_names = getattr(conn, '_prepared_names', None)
+    if prepared_names is None:
+        prepared_names = conn._prepared_names = set()
+
+    # 공유 연결은 동시 쿼리를 지원하지 않으므로 직렬화
+    async with get_transaction_lock(conn):
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            if name not in prepared_names:
+                await cursor.execute(f"PREPARE {name} FROM %s", (sql,))
+                prepared_names.add(name)
+
+            if params:
+                # EXECUTE ... USING은 사용자 변수만 받으므로 파라미터를 바인딩
+                var_names = [f"@p{i}" for i in range(len(params))]
+                for var_name, value in zip(var_names, params):
+                    await cursor.execute(f"SET {var_name} = %s", (value,))
+                await cursor.execute(f"EXECUTE {name} USING {', '.join(var_names)}")
+            else:
+                await cursor.execute(f"EXECUTE {name}")
+
+            if cursor.description:
+                return await cursor.fetchall()
+            return cursor.lastrowid or cursor.rowcount
+
+
+# INSERT 문의 VALUES 절 추출용 (bulk_insert에서 행 플레이스홀더 복제에 사용)
+_VALUES_RE = re.compile(r'VALUES\s*\(([^)]+)\)', re.IGNORECASE)
+
+
+async def bulk_insert(query: str, rows: List[tuple], chunk_size: int = 500) -> int:
+    """
+    단일-행 INSERT 쿼리를 multi-row VALUES로 재작성해 일괄 실행
+
+    executemany는 드라이버/쿼리 형태에 따라 행 단위 실행으로 떨어질 수 있으므로,
+    VALUES 절을 클라이언트에서 (...), (...), ... 로 복제해
+    청크당 한 문장만 전송합니다 (왕복 횟수: 행 수 → 청크 수).
+
+    Args:
+        query: 단일 행 INSERT 쿼리 (예: "INSERT INTO t (a, b) VALUES (%s, %s)")
+        rows: 행별 파라미터 튜플 리스트
+        chunk_size: 한 문장에 담을 최대 행 수 (max_allowed_packet 초과 방지)
+
+    Returns:
+        int: 영향받은 총 행 수
+
+    Example:
+        rows = await bulk_insert(
+            "INSERT INTO users (username, email) VALUES (%s, %s)",
+            [("john", "john@example.com"), ("jane", "jane@example.com")]
+        )
+    """
+    if not rows:
+        return 0
+
+    match = _VALUES_RE.search(query)
+    if match is None:
+        raise ValueError("INSERT ... VALUES (...) 형태의 쿼리만 지원합니다")
+
+    prefix = query[:match.start()]
+    row_placeholder = f"({match.group(1)})"
+    suffix = query[match.end():]
+
+    conn = await get_db_connection()
+    try:
+        async with conn.cursor() as cursor:
+            total = 0
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                sql = (
+                    prefix
+                    + "VALUES "
+                    + ", ".join([row_placeholder] * len(chunk))
+                    + suffix
+                )
+                flat_params = [value for row in chunk for value in row]
+                await cursor.execute(sql, flat_params)
+                total += cursor.rowcount
+            await conn.commit()
+            return total
+    except Exception as e:
+        await conn.rollback()
+        raise e
+    finally:
+        conn.close()
+
+
 async def test_connection() -> bool:
     """
     데이터베이스 연결 테스트
@@ -2,10 +2,13 @@
 File domain entity
 app/domain/entities/file.py
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+# 이미지 확장자 집합 (모듈 로드 시 1회 생성)
+IMAGE_EXTENSIONS = frozenset(['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg'])
+
 
 @dataclass
 class FileEntity:
@@ -27,18 +30,25 @@ class FileEntity:
     created_at: Optional[datetime] = None
     is_deleted: bool = False
     is_public: bool = True
+    content_hash: Optional[str] = None  # SHA-256 해시 (중복 제거/무결성 검증용)
     password: Optional[str] = None  # 게스트 파일 비밀번호 (해시)
 
     # JOIN용 업로더 정보 (Optional)
     uploader_username: Optional[str] = None
     uploader_email: Optional[str] = None
 
-    def is_image(self) -> bool:
-        """이미지 파일 여부 확인"""
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg']
+    # 생성 시 1회 계산되는 캐시 (반복 호출되는 분류 검사용)
+    _is_image: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
         if self.file_extension:
-            return self.file_extension.lower() in image_extensions
-        return self.mime_type.startswith('image/')
+            self._is_image = self.file_extension.lower() in IMAGE_EXTENSIONS
+        else:
+            self._is_image = self.mime_type.startswith('image/')
+
+    def is_image(self) -> bool:
+        """이미지 파일 여부 확인 (생성 시 캐시된 값 반환)"""
+        return self._is_image
 
     def is_video(self) -> bool:
         """동영상 파일 여부 확인"""
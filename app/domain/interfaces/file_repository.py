@@ -20,7 +20,8 @@ class FileRepositoryProtocol(Protocol):
             file_extension: Optional[str],
             uploader_id: int,
             upload_ip: Optional[str],
-            is_public: bool = True
+            is_public: bool = True,
+            content_hash: Optional[str] = None
     ) -> FileEntity:
         """파일 생성"""
         ...
@@ -33,6 +34,10 @@ class FileRepositoryProtocol(Protocol):
         """저장된 파일명으로 조회"""
         ...
 
+    async def find_by_content_hash(self, content_hash: str) -> Optional[FileEntity]:
+        """콘텐츠 해시로 조회 (중복 업로드 탐지)"""
+        ...
+
     async def find_by_uploader(
             self,
             uploader_id: int,
@@ -101,9 +106,9 @@ class TempFileRepositoryProtocol(Protocol):
             self,
             file_id: int,
             uploader_id: int,
-            expires_at: datetime
+            expires_in_hours: int = 24
     ) -> TempFileEntity:
-        """임시 파일 생성"""
+        """임시 파일 생성 (만료 시각은 DB 서버 시계 기준으로 계산)"""
         ...
 
     async def find_by_file_id(self, file_id: int) -> Optional[TempFileEntity]:
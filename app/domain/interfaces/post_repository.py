@@ -51,6 +51,10 @@ class PostRepositoryProtocol(Protocol):
         """
         ...
 
+    async def approx_count(self) -> Optional[int]:
+        """posts 테이블의 근사 행 수 조회 (통계가 없으면 None)"""
+        ...
+
     async def update(self, post_id: int, **fields) -> Optional[PostEntity]:
         """게시글 정보 업데이트"""
         ...
@@ -63,26 +67,26 @@ class PostRepositoryProtocol(Protocol):
         """게시글 비활성화 (Soft Delete)"""
         ...
 
-    async def restore(self, post_id: int) -> bool:
-        """삭제된 게시글 복구"""
+    async def restore(self, post_id: int) -> Optional[PostEntity]:
+        """삭제된 게시글 복구 (복구된 게시글 반환, 없거나 이미 활성화된 경우 None)"""
         ...
 
     async def increment_view_count(self, post_id: int) -> None:
         """조회수 증가"""
         ...
 
-    async def increment_like_count(self, post_id: int) -> None:
-        """좋아요 수 증가"""
+    async def increment_like_count(self, post_id: int) -> Optional[PostEntity]:
+        """좋아요 수 증가 (업데이트된 게시글 반환, 없거나 삭제된 경우 None)"""
         ...
 
-    async def decrement_like_count(self, post_id: int) -> None:
-        """좋아요 수 감소"""
+    async def decrement_like_count(self, post_id: int) -> Optional[PostEntity]:
+        """좋아요 수 감소 (업데이트된 게시글 반환, 없거나 삭제된 경우 None)"""
         ...
 
-    async def toggle_pin(self, post_id: int) -> bool:
-        """게시글 고정/고정 해제 토글"""
+    async def toggle_pin(self, post_id: int) -> Optional[PostEntity]:
+        """게시글 고정/고정 해제 토글 (토글된 게시글 반환, 없으면 None)"""
         ...
 
-    async def toggle_lock(self, post_id: int) -> bool:
-        """게시글 잠금/잠금 해제 토글"""
+    async def toggle_lock(self, post_id: int) -> Optional[PostEntity]:
+        """게시글 잠금/잠금 해제 토글 (토글된 게시글 반환, 없으면 None)"""
         ...
\ No newline at end of file
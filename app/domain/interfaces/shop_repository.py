@@ -26,8 +26,8 @@ class ShopRepositoryProtocol(Protocol):
             logo_image_url: Optional[str] = None,
             banner_image_url: Optional[str] = None,
             use_display: bool = True
-    ) -> ShopEntity:
-        """상점 생성"""
+    ) -> Optional[ShopEntity]:
+        """상점 생성 (shop_code 중복 시 None)"""
         ...
 
     async def find_by_shop_no(self, shop_no: int) -> Optional[ShopEntity]:
@@ -38,8 +38,13 @@ class ShopRepositoryProtocol(Protocol):
         """상점 코드로 조회"""
         ...
 
-    async def find_by_owner(self, owner_user_no: int) -> List[ShopEntity]:
-        """운영자로 상점 목록 조회"""
+    async def find_by_owner(
+            self,
+            owner_user_no: int,
+            after_shop_no: Optional[int] = None,
+            limit: int = 50
+    ) -> tuple[List[ShopEntity], Optional[int]]:
+        """운영자로 상점 목록 조회 (shop_no 키셋 페이징, 다음 커서 반환)"""
         ...
 
     async def find_all(
@@ -63,8 +68,8 @@ class ShopRepositoryProtocol(Protocol):
         """상점 소프트 삭제 (deleted_at 설정)"""
         ...
 
-    async def restore(self, shop_no: int) -> bool:
-        """삭제된 상점 복구"""
+    async def restore(self, shop_no: int) -> Optional[ShopEntity]:
+        """삭제된 상점 복구 (복구된 상점 반환, 없으면 None)"""
         ...
 
     async def hard_delete(self, shop_no: int) -> bool:
@@ -75,10 +80,10 @@ class ShopRepositoryProtocol(Protocol):
         """상점 코드 중복 체크"""
         ...
 
-    async def update_status(self, shop_no: int, shop_status: ShopStatus) -> bool:
-        """상점 상태 변경"""
+    async def update_status(self, shop_no: int, shop_status: ShopStatus) -> Optional[ShopEntity]:
+        """상점 상태 변경 (변경된 상점 반환, 없으면 None)"""
         ...
 
-    async def toggle_display(self, shop_no: int) -> bool:
-        """노출 여부 토글"""
+    async def toggle_display(self, shop_no: int) -> Optional[ShopEntity]:
+        """노출 여부 토글 (토글된 상점 반환, 없으면 None)"""
         ...
\ No newline at end of file
@@ -70,6 +70,19 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
+    async def check_conflicts(self, email: str, username: str) -> set:
+        """
+        이메일/사용자명 충돌 확인 (단일 쿼리)
+
+        Args:
+            email: 확인할 이메일
+            username: 확인할 사용자명
+
+        Returns:
+            set: {'email', 'username'}의 부분집합 (충돌하는 항목만 포함)
+        """
+        ...
+
     async def find_all(
         self,
         skip: int = 0,
@@ -1,5 +1,15 @@
+import asyncio
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+
+try:
+    # orjson: SIMD 기반 직렬화로 목록형 JSON 응답 인코딩이 수 배 빠름
+    # (ORJSONResponse 자체는 orjson 없이도 import되므로 orjson을 직접 확인)
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _default_response_class
+except ImportError:  # pragma: no cover - orjson 미설치 환경 fallback
+    from fastapi.responses import JSONResponse as _default_response_class
 from app.api.v1 import users, auth, posts, files, comments, shops, categories  # Clean Architecture v1 라우터
 from app.core.config import settings
 from app.core.logging import logger
@@ -11,7 +21,8 @@ app = FastAPI(
     description="FastAPI 사용자, 게시글, 파일, 코멘트 Backend 시스템",
     version="1.0.0",
     docs_url=None if settings.ENVIRONMENT == "production" else "/docs",
-    redoc_url=None if settings.ENVIRONMENT == "production" else "/redoc"
+    redoc_url=None if settings.ENVIRONMENT == "production" else "/redoc",
+    default_response_class=_default_response_class
 )
 
 # CORS 설정
@@ -71,6 +82,10 @@ app.include_router(
     tags=["categories"]
 )
 
+# 백그라운드 태스크 (startup에서 기동, shutdown에서 정리)
+_background_tasks: list = []
+
+
 @app.on_event("startup")
 async def startup_event():
     """앱 시작 시 이벤트"""
@@ -81,10 +96,22 @@ async def startup_event():
     logger.info(f"Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
     logger.info("=" * 60)
 
+    # 조회수 버퍼 주기 flush 태스크 기동
+    from app.services.post_service import view_count_flush_loop
+    _background_tasks.append(asyncio.create_task(view_count_flush_loop()))
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 이벤트"""
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+
+    # 버퍼에 남은 조회수 증분을 마지막으로 flush
+    from app.services.post_service import flush_view_counts
+    await flush_view_counts()
+
     logger.info("🛑 FastAPI 애플리케이션 종료")
 
 
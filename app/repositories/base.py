@@ -2,8 +2,9 @@
 Base repository with common database operations
 """
 import aiomysql
+from contextlib import nullcontext
 from typing import Optional, Dict, Any, List
-from app.db.database import get_db_connection
+from app.db.database import get_db_connection, get_transaction_connection, get_transaction_lock
 
 
 class BaseRepository:
@@ -12,8 +13,18 @@ class BaseRepository:
 
     공통 데이터베이스 작업을 위한 헬퍼 메서드를 제공합니다.
     모든 repository는 이 클래스를 상속받아 사용합니다.
+
+    transaction() 범위 안에서 호출되면 해당 범위의 공유 연결을 재사용하며,
+    커밋/롤백은 transaction()이 담당합니다 (app/db/database.py 참고).
+    공유 연결은 동시 쿼리를 지원하지 않으므로 (asyncio.gather로 묶인
+    호출 등) 연결에 부착된 Lock으로 직렬화합니다.
     """
 
+    @staticmethod
+    def _tx_guard(tx_conn):
+        """공유 연결이면 직렬화 Lock, 독립 연결이면 no-op 컨텍스트"""
+        return get_transaction_lock(tx_conn) if tx_conn is not None else nullcontext()
+
     async def _fetch_one(
         self,
         query: str,
@@ -29,13 +40,16 @@ class BaseRepository:
         Returns:
             Optional[Dict[str, Any]]: 조회된 행 (dict 형태) 또는 None
         """
-        conn = await get_db_connection()
+        tx_conn = get_transaction_connection()
+        conn = tx_conn or await get_db_connection()
         try:
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(query, params)
-                return await cursor.fetchone()
+            async with self._tx_guard(tx_conn):
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params)
+                    return await cursor.fetchone()
         finally:
-            conn.close()
+            if tx_conn is None:
+                conn.close()
 
     async def _fetch_all(
         self,
@@ -52,13 +66,16 @@ class BaseRepository:
         Returns:
             List[Dict[str, Any]]: 조회된 행 목록 (dict 형태)
         """
-        conn = await get_db_connection()
+        tx_conn = get_transaction_connection()
+        conn = tx_conn or await get_db_connection()
         try:
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(query, params)
-                return await cursor.fetchall()
+            async with self._tx_guard(tx_conn):
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params)
+                    return await cursor.fetchall()
         finally:
-            conn.close()
+            if tx_conn is None:
+                conn.close()
 
     async def _execute(
         self,
@@ -79,20 +96,26 @@ class BaseRepository:
         Raises:
             Exception: 쿼리 실행 실패 시 (롤백 후 예외 발생)
         """
-        conn = await get_db_connection()
+        tx_conn = get_transaction_connection()
+        conn = tx_conn or await get_db_connection()
         try:
-            async with conn.cursor() as cursor:
-                await cursor.execute(query, params)
-                await conn.commit()
-
-                # INSERT의 경우 새로 생성된 ID 반환
-                if query.strip().upper().startswith('INSERT'):
-                    return cursor.lastrowid
-                # UPDATE/DELETE의 경우 영향받은 행 수 반환
-                else:
-                    return cursor.rowcount
+            async with self._tx_guard(tx_conn):
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    # 트랜잭션 범위 안에서는 범위 종료 시 1회만 COMMIT
+                    if tx_conn is None:
+                        await conn.commit()
+
+                    # INSERT의 경우 새로 생성된 ID 반환
+                    if query.strip().upper().startswith('INSERT'):
+                        return cursor.lastrowid
+                    # UPDATE/DELETE의 경우 영향받은 행 수 반환
+                    else:
+                        return cursor.rowcount
         except Exception as e:
-            await conn.rollback()
+            if tx_conn is None:
+                await conn.rollback()
             raise e
         finally:
-            conn.close()
+            if tx_conn is None:
+                conn.close()
@@ -15,6 +15,15 @@ class CommentRepository(BaseRepository):
     Tree 구조의 계층형 댓글 시스템 구현
     """
 
+    # 허용된 업데이트 필드 화이트리스트 (SQL Injection 방지, 클래스 로드 시 1회 구성)
+    ALLOWED_UPDATE_FIELDS = frozenset({
+        'content', 'is_deleted', 'path'
+    })
+
+    # 필드별 SET 절 조각과 boolean 필드 집합 (클래스 로드 시 1회 생성)
+    _SET_FRAGMENTS = {field: f"{field} = %s" for field in ALLOWED_UPDATE_FIELDS}
+    _BOOL_FIELDS = frozenset({'is_deleted'})
+
     def _to_entity(self, row: Optional[dict]) -> Optional[CommentEntity]:
         """데이터베이스 row를 CommentEntity로 변환"""
         if not row:
@@ -222,26 +231,22 @@ class CommentRepository(BaseRepository):
         if not fields:
             return await self.find_by_id(comment_id)
 
-        # 허용된 필드 화이트리스트 (SQL Injection 방지)
-        ALLOWED_UPDATE_FIELDS = {
-            'content', 'is_deleted', 'path'
-        }
+        # 필드명 검증: 차집합 한 번으로 전체 검사 (필드별 멤버십 비교 제거)
+        extra = fields.keys() - self.ALLOWED_UPDATE_FIELDS
+        if extra:
+            extra_fields = ', '.join(sorted(extra))
+            logger.warning(f"Attempted to update disallowed field: {extra_fields}")
+            raise ValueError(f"허용되지 않은 필드입니다: {extra_fields}")
 
         # UPDATE 쿼리 동적 생성
         update_fields = []
         params = []
 
         for field, value in fields.items():
-            # 필드명 검증
-            if field not in ALLOWED_UPDATE_FIELDS:
-                logger.warning(f"Attempted to update disallowed field: {field}")
-                raise ValueError(f"허용되지 않은 필드입니다: {field}")
-
-            if field in ['is_deleted']:
-                update_fields.append(f"{field} = %s")
+            update_fields.append(self._SET_FRAGMENTS[field])
+            if field in self._BOOL_FIELDS:
                 params.append(1 if value else 0)
             else:
-                update_fields.append(f"{field} = %s")
                 params.append(value)
 
         params.append(comment_id)
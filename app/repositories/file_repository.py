@@ -31,6 +31,7 @@ class FileRepository(BaseRepository):
             created_at=row.get('created_at'),
             is_deleted=bool(row.get('is_deleted', 0)),
             is_public=bool(row.get('is_public', 1)),
+            content_hash=row.get('content_hash'),
             # JOIN시 업로더 정보
             uploader_username=row.get('uploader_username'),
             uploader_email=row.get('uploader_email')
@@ -46,20 +47,21 @@ class FileRepository(BaseRepository):
             file_extension: Optional[str],
             uploader_id: int,
             upload_ip: Optional[str],
-            is_public: bool = True
+            is_public: bool = True,
+            content_hash: Optional[str] = None
     ) -> FileEntity:
         """파일 생성"""
         query = """
                 INSERT INTO files (
                     original_filename, stored_filename, file_path, file_size, mime_type,
-                    file_extension, uploader_id, upload_ip, is_public, is_deleted
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 0) \
+                    file_extension, uploader_id, upload_ip, is_public, content_hash, is_deleted
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0) \
                 """
         file_id = await self._execute(
             query,
             (
                 original_filename, stored_filename, file_path, file_size, mime_type,
-                file_extension, uploader_id, upload_ip, 1 if is_public else 0
+                file_extension, uploader_id, upload_ip, 1 if is_public else 0, content_hash
             )
         )
 
@@ -76,7 +78,7 @@ class FileRepository(BaseRepository):
                 SELECT
                     f.id, f.original_filename, f.stored_filename, f.file_path, f.file_size,
                     f.mime_type, f.file_extension, f.uploader_id, f.upload_ip,
-                    f.download_count, f.created_at, f.is_deleted, f.is_public,
+                    f.download_count, f.created_at, f.is_deleted, f.is_public, f.content_hash,
                     u.username as uploader_username, u.email as uploader_email
                 FROM files f
                          LEFT JOIN users u ON f.uploader_id = u.id
@@ -91,13 +93,28 @@ class FileRepository(BaseRepository):
                 SELECT
                     f.id, f.original_filename, f.stored_filename, f.file_path, f.file_size,
                     f.mime_type, f.file_extension, f.uploader_id, f.upload_ip,
-                    f.download_count, f.created_at, f.is_deleted, f.is_public
+                    f.download_count, f.created_at, f.is_deleted, f.is_public, f.content_hash
                 FROM files f
                 WHERE f.stored_filename = %s \
                 """
         row = await self._fetch_one(query, (stored_filename,))
         return self._to_entity(row)
 
+    async def find_by_content_hash(self, content_hash: str) -> Optional[FileEntity]:
+        """콘텐츠 해시로 조회 (중복 업로드 탐지)"""
+        query = """
+                SELECT
+                    f.id, f.original_filename, f.stored_filename, f.file_path, f.file_size,
+                    f.mime_type, f.file_extension, f.uploader_id, f.upload_ip,
+                    f.download_count, f.created_at, f.is_deleted, f.is_public, f.content_hash
+                FROM files f
+                WHERE f.content_hash = %s AND f.is_deleted = 0
+                ORDER BY f.id
+                LIMIT 1 \
+                """
+        row = await self._fetch_one(query, (content_hash,))
+        return self._to_entity(row)
+
     async def find_by_uploader(
             self,
             uploader_id: int,
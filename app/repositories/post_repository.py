@@ -2,11 +2,17 @@
 Post repository implementation
 app/repositories/post_repository.py
 """
+import asyncio
 from typing import Optional, List
 from app.repositories.base import BaseRepository
+from app.db.database import transaction
 from app.domain.entities.post import PostEntity
 from app.core.logging import logger
 
+# find_all에서 허용하는 정렬 컬럼/순서 (매 호출 리스트 생성을 피해 모듈 상수로)
+_ALLOWED_SORT_COLUMNS = frozenset({'id', 'title', 'created_at', 'updated_at', 'view_count', 'like_count'})
+_ALLOWED_SORT_ORDERS = frozenset({'ASC', 'DESC'})
+
 
 class PostRepository(BaseRepository):
     """
@@ -15,6 +21,15 @@ class PostRepository(BaseRepository):
     PostRepositoryProtocol을 구현하며, 게시글 데이터에 대한 모든 데이터베이스 작업을 담당합니다.
     """
 
+    # 허용된 업데이트 필드 화이트리스트 (SQL Injection 방지, 클래스 로드 시 1회 구성)
+    ALLOWED_UPDATE_FIELDS = frozenset({
+        'title', 'content', 'is_pinned', 'is_locked', 'is_deleted'
+    })
+
+    # 필드별 SET 절 조각과 boolean 필드 집합 (클래스 로드 시 1회 생성)
+    _SET_FRAGMENTS = {field: f"{field} = %s" for field in ALLOWED_UPDATE_FIELDS}
+    _BOOL_FIELDS = frozenset({'is_pinned', 'is_locked', 'is_deleted'})
+
     def _to_entity(self, row: Optional[dict]) -> Optional[PostEntity]:
         """
         데이터베이스 row를 PostEntity로 변환
@@ -139,24 +154,18 @@ class PostRepository(BaseRepository):
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
         # 허용된 정렬 컬럼 검증
-        allowed_sort_columns = ['id', 'title', 'created_at', 'updated_at', 'view_count', 'like_count']
-        if sort_by not in allowed_sort_columns:
+        if sort_by not in _ALLOWED_SORT_COLUMNS:
             sort_by = 'created_at'
 
         # 정렬 순서 검증
         sort_order = sort_order.upper()
-        if sort_order not in ['ASC', 'DESC']:
+        if sort_order not in _ALLOWED_SORT_ORDERS:
             sort_order = 'DESC'
 
-        # 전체 개수 조회
-        count_query = f"SELECT COUNT(*) as total FROM posts p WHERE {where_clause}"
-        count_row = await self._fetch_one(count_query, tuple(params))
-        total = count_row['total'] if count_row else 0
-
         # 게시글 목록 조회 (작성자 정보 포함)
         # 고정 게시글이 먼저 나오도록 정렬
         query = f"""
-            SELECT 
+            SELECT
                 p.id, p.title, p.content, p.author_id, p.view_count, p.like_count,
                 p.created_at, p.updated_at, p.is_deleted, p.is_pinned, p.is_locked,
                 u.username as author_username, u.email as author_email
@@ -166,8 +175,27 @@ class PostRepository(BaseRepository):
             ORDER BY p.is_pinned DESC, p.{sort_by} {sort_order}
             LIMIT %s OFFSET %s
         """
-        params.extend([limit, skip])
-        rows = await self._fetch_all(query, tuple(params))
+        list_params = tuple(params + [limit, skip])
+
+        # 목록 조회와 개수 조회는 서로 독립이므로 동시에 실행 (RTT 1회 절감)
+        # 필터가 없는 기본 목록은 매 요청 COUNT(*) 풀스캔 대신 근사치 사용
+        # (total은 total_pages 계산에만 쓰이므로 근사로 충분)
+        count_query = f"SELECT COUNT(*) as total FROM posts p WHERE {where_clause}"
+        if search is None and author_id is None and is_pinned is None:
+            rows, total = await asyncio.gather(
+                self._fetch_all(query, list_params),
+                self.approx_count()
+            )
+            if total is None:
+                # 통계가 없으면 정확한 개수로 대체
+                count_row = await self._fetch_one(count_query, tuple(params))
+                total = count_row['total'] if count_row else 0
+        else:
+            rows, count_row = await asyncio.gather(
+                self._fetch_all(query, list_params),
+                self._fetch_one(count_query, tuple(params))
+            )
+            total = count_row['total'] if count_row else 0
 
         posts = [self._to_entity(row) for row in rows]
 
@@ -175,6 +203,24 @@ class PostRepository(BaseRepository):
 
         return posts, total
 
+    async def approx_count(self) -> Optional[int]:
+        """
+        posts 테이블의 근사 행 수 조회
+
+        information_schema 통계(table_rows)를 사용하므로 COUNT(*) 풀스캔 없이
+        상수 시간에 반환됩니다. 통계가 없으면 None을 반환합니다.
+        """
+        row = await self._fetch_one(
+            """
+            SELECT table_rows
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name = 'posts'
+            """
+        )
+        if row is None or row.get('table_rows') is None:
+            return None
+        return int(row['table_rows'])
+
     async def update(self, post_id: int, **fields) -> Optional[PostEntity]:
         """
         게시글 정보 업데이트
@@ -189,27 +235,23 @@ class PostRepository(BaseRepository):
         if not fields:
             return await self.find_by_id(post_id)
 
-        # 허용된 필드 화이트리스트 (SQL Injection 방지)
-        ALLOWED_UPDATE_FIELDS = {
-            'title', 'content', 'is_pinned', 'is_locked', 'is_deleted'
-        }
+        # 필드명 검증: 차집합 한 번으로 전체 검사 (필드별 멤버십 비교 제거)
+        extra = fields.keys() - self.ALLOWED_UPDATE_FIELDS
+        if extra:
+            extra_fields = ', '.join(sorted(extra))
+            logger.warning(f"Attempted to update disallowed field: {extra_fields}")
+            raise ValueError(f"허용되지 않은 필드입니다: {extra_fields}")
 
         # UPDATE 쿼리 동적 생성
         update_fields = []
         params = []
 
         for field, value in fields.items():
-            # 필드명 검증
-            if field not in ALLOWED_UPDATE_FIELDS:
-                logger.warning(f"Attempted to update disallowed field: {field}")
-                raise ValueError(f"허용되지 않은 필드입니다: {field}")
-
+            update_fields.append(self._SET_FRAGMENTS[field])
             # boolean 필드 처리
-            if field in ['is_pinned', 'is_locked', 'is_deleted']:
-                update_fields.append(f"{field} = %s")
+            if field in self._BOOL_FIELDS:
                 params.append(1 if value else 0)
             else:
-                update_fields.append(f"{field} = %s")
                 params.append(value)
 
         # updated_at은 자동 업데이트 (ON UPDATE CURRENT_TIMESTAMP)
@@ -251,16 +293,19 @@ class PostRepository(BaseRepository):
         """
         게시글 비활성화 (Soft Delete)
 
+        is_deleted = 0 조건을 포함한 단일 UPDATE로 수행하므로
+        동시 요청이 와도 한 쪽만 성공합니다 (TOCTOU 방지).
+
         Args:
             post_id: 게시글 ID
 
         Returns:
-            bool: 비활성화 성공 여부
+            bool: 비활성화 성공 여부 (없거나 이미 삭제된 경우 False)
         """
         query = """
                 UPDATE posts
                 SET is_deleted = 1
-                WHERE id = %s \
+                WHERE id = %s AND is_deleted = 0 \
                 """
         rows_affected = await self._execute(query, (post_id,))
 
@@ -270,28 +315,31 @@ class PostRepository(BaseRepository):
 
         return success
 
-    async def restore(self, post_id: int) -> bool:
+    async def restore(self, post_id: int) -> Optional[PostEntity]:
         """
-        삭제된 게시글 복구
+        삭제된 게시글 복구 (복구된 게시글 반환)
+
+        is_deleted = 1 조건을 포함한 UPDATE와 결과 조회를 한 트랜잭션(한 연결)으로
+        묶어, 서비스 계층의 별도 재조회 왕복 없이 복구된 게시글을 돌려줍니다.
 
         Args:
             post_id: 게시글 ID
 
         Returns:
-            bool: 복구 성공 여부
+            Optional[PostEntity]: 복구된 게시글 (없거나 이미 활성화된 경우 None)
         """
         query = """
                 UPDATE posts
                 SET is_deleted = 0
-                WHERE id = %s \
+                WHERE id = %s AND is_deleted = 1 \
                 """
-        rows_affected = await self._execute(query, (post_id,))
+        async with transaction():
+            rows_affected = await self._execute(query, (post_id,))
+            if rows_affected == 0:
+                return None
 
-        success = rows_affected > 0
-        if success:
             logger.info(f"Post restored - ID: {post_id}")
-
-        return success
+            return await self.find_by_id(post_id)
 
     async def increment_view_count(self, post_id: int) -> None:
         """조회수 증가 (Race Condition 방지)"""
@@ -303,70 +351,86 @@ class PostRepository(BaseRepository):
         await self._execute(query, (post_id,))
         logger.debug(f"View count incremented - ID: {post_id}")
 
-    async def increment_like_count(self, post_id: int) -> None:
-        """좋아요 수 증가"""
+    async def increment_like_count(self, post_id: int) -> Optional[PostEntity]:
+        """
+        좋아요 수 증가 (단일 UPDATE + 결과 조회)
+
+        Returns:
+            Optional[PostEntity]: 업데이트된 게시글, 없거나 삭제된 경우 None
+        """
         query = """
                 UPDATE posts
                 SET like_count = like_count + 1
-                WHERE id = %s \
+                WHERE id = %s AND is_deleted = 0 \
                 """
-        await self._execute(query, (post_id,))
-        logger.debug(f"Like count incremented - ID: {post_id}")
+        async with transaction():
+            rows_affected = await self._execute(query, (post_id,))
+            if rows_affected == 0:
+                return None
 
-    async def decrement_like_count(self, post_id: int) -> None:
-        """좋아요 수 감소"""
+            logger.debug(f"Like count incremented - ID: {post_id}")
+            return await self.find_by_id(post_id)
+
+    async def decrement_like_count(self, post_id: int) -> Optional[PostEntity]:
+        """
+        좋아요 수 감소 (단일 UPDATE + 결과 조회)
+
+        Returns:
+            Optional[PostEntity]: 업데이트된 게시글, 없거나 삭제된 경우 None
+        """
         query = """
                 UPDATE posts
                 SET like_count = GREATEST(like_count - 1, 0)
-                WHERE id = %s \
+                WHERE id = %s AND is_deleted = 0 \
                 """
-        await self._execute(query, (post_id,))
-        logger.debug(f"Like count decremented - ID: {post_id}")
+        async with transaction():
+            await self._execute(query, (post_id,))
+
+            # like_count가 이미 0이면 rowcount가 0이 될 수 있으므로 조회로 존재 여부 판별
+            post = await self.find_by_id(post_id)
+            if not post or post.is_deleted:
+                return None
 
-    async def toggle_pin(self, post_id: int) -> bool:
+            logger.debug(f"Like count decremented - ID: {post_id}")
+            return post
+
+    async def toggle_pin(self, post_id: int) -> Optional[PostEntity]:
         """
-        게시글 고정/고정 해제 토글
+        게시글 고정/고정 해제 토글 (단일 UPDATE + 결과 조회)
 
         Returns:
-            bool: 토글 후 is_pinned 상태
+            Optional[PostEntity]: 토글된 게시글, 없으면 None
         """
-        # 현재 상태 조회
-        post = await self.find_by_id(post_id)
-        if not post:
-            return False
-
-        new_pinned_state = not post.is_pinned
-
+        # 사전 조회 없이 DB에서 직접 토글 (원자적, 왕복 1회 절약)
         query = """
                 UPDATE posts
-                SET is_pinned = %s
+                SET is_pinned = NOT is_pinned
                 WHERE id = %s \
                 """
-        await self._execute(query, (1 if new_pinned_state else 0, post_id))
+        rows_affected = await self._execute(query, (post_id,))
+        if rows_affected == 0:
+            return None
 
-        logger.info(f"Post pin toggled - ID: {post_id}, is_pinned: {new_pinned_state}")
-        return new_pinned_state
+        post = await self.find_by_id(post_id)
+        logger.info(f"Post pin toggled - ID: {post_id}, is_pinned: {post.is_pinned if post else None}")
+        return post
 
-    async def toggle_lock(self, post_id: int) -> bool:
+    async def toggle_lock(self, post_id: int) -> Optional[PostEntity]:
         """
-        게시글 잠금/잠금 해제 토글
+        게시글 잠금/잠금 해제 토글 (단일 UPDATE + 결과 조회)
 
         Returns:
-            bool: 토글 후 is_locked 상태
+            Optional[PostEntity]: 토글된 게시글, 없으면 None
         """
-        # 현재 상태 조회
-        post = await self.find_by_id(post_id)
-        if not post:
-            return False
-
-        new_locked_state = not post.is_locked
-
         query = """
                 UPDATE posts
-                SET is_locked = %s
+                SET is_locked = NOT is_locked
                 WHERE id = %s \
                 """
-        await self._execute(query, (1 if new_locked_state else 0, post_id))
+        rows_affected = await self._execute(query, (post_id,))
+        if rows_affected == 0:
+            return None
 
-        logger.info(f"Post lock toggled - ID: {post_id}, is_locked: {new_locked_state}")
-        return new_locked_state
\ No newline at end of file
+        post = await self.find_by_id(post_id)
+        logger.info(f"Post lock toggled - ID: {post_id}, is_locked: {post.is_locked if post else None}")
+        return post
\ No newline at end of file
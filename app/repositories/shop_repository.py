@@ -2,9 +2,11 @@
 Shop repository implementation
 app/repositories/shop_repository.py
 """
+import pymysql
 from typing import Optional, List
 from datetime import datetime
 from app.repositories.base import BaseRepository
+from app.db.database import transaction
 from app.domain.entities.shop import ShopEntity, ShopType, ShopStatus
 from app.core.logging import logger
 
@@ -60,8 +62,13 @@ class ShopRepository(BaseRepository):
             logo_image_url: Optional[str] = None,
             banner_image_url: Optional[str] = None,
             use_display: bool = True
-    ) -> ShopEntity:
-        """상점 생성"""
+    ) -> Optional[ShopEntity]:
+        """
+        상점 생성
+
+        shop_code 중복 여부는 사전 SELECT 대신 UNIQUE 제약에 맡깁니다
+        (docs/add_shop_code_unique_index.sql 참고). 중복이면 None을 반환합니다.
+        """
         query = """
                 INSERT INTO shops (
                     shop_name, shop_code, shop_type, owner_user_no,
@@ -71,16 +78,23 @@ class ShopRepository(BaseRepository):
                     shop_description, logo_image_url, banner_image_url
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'ACTIVE', %s, %s, %s, %s) \
                 """
-        shop_no = await self._execute(
-            query,
-            (
-                shop_name, shop_code, shop_type.value, owner_user_no,
-                business_number, company_name,
-                contact_email, contact_phone, contact_address, contact_address_detail, zipcode,
-                'T' if use_display else 'F',
-                shop_description, logo_image_url, banner_image_url
+        try:
+            shop_no = await self._execute(
+                query,
+                (
+                    shop_name, shop_code, shop_type.value, owner_user_no,
+                    business_number, company_name,
+                    contact_email, contact_phone, contact_address, contact_address_detail, zipcode,
+                    'T' if use_display else 'F',
+                    shop_description, logo_image_url, banner_image_url
+                )
             )
-        )
+        except pymysql.err.IntegrityError as e:
+            # 1062: Duplicate entry (UNIQUE 제약 위반)
+            if e.args and e.args[0] == 1062:
+                logger.warning(f"Duplicate shop code - code: {shop_code}")
+                return None
+            raise
 
         logger.info(
             f"Shop created - shop_no: {shop_no}, code: {shop_code}, owner: {owner_user_no}"
@@ -116,16 +130,38 @@ class ShopRepository(BaseRepository):
         row = await self._fetch_one(query, (shop_code,))
         return self._to_entity(row)
 
-    async def find_by_owner(self, owner_user_no: int) -> List[ShopEntity]:
-        """운영자로 상점 목록 조회"""
-        query = """
-                SELECT s.*
-                FROM shops s
-                WHERE s.owner_user_no = %s AND s.deleted_at IS NULL
-                ORDER BY s.created_at DESC \
-                """
-        rows = await self._fetch_all(query, (owner_user_no,))
-        return [self._to_entity(row) for row in rows]
+    async def find_by_owner(
+            self,
+            owner_user_no: int,
+            after_shop_no: Optional[int] = None,
+            limit: int = 50
+    ) -> tuple[List[ShopEntity], Optional[int]]:
+        """운영자로 상점 목록 조회 (shop_no 키셋 페이징)"""
+        # OFFSET은 건너뛴 행도 스캔하므로 shop_no 커서 조건으로 대체
+        if after_shop_no is not None:
+            query = """
+                    SELECT s.*
+                    FROM shops s
+                    WHERE s.owner_user_no = %s AND s.deleted_at IS NULL AND s.shop_no > %s
+                    ORDER BY s.shop_no
+                    LIMIT %s \
+                    """
+            params = (owner_user_no, after_shop_no, limit)
+        else:
+            query = """
+                    SELECT s.*
+                    FROM shops s
+                    WHERE s.owner_user_no = %s AND s.deleted_at IS NULL
+                    ORDER BY s.shop_no
+                    LIMIT %s \
+                    """
+            params = (owner_user_no, limit)
+        rows = await self._fetch_all(query, params)
+        shops = [self._to_entity(row) for row in rows]
+
+        # 페이지가 가득 찬 경우에만 다음 커서 제공 (마지막 페이지면 None)
+        next_cursor = shops[-1].shop_no if len(shops) == limit else None
+        return shops, next_cursor
 
     async def find_all(
             self,
@@ -234,11 +270,16 @@ class ShopRepository(BaseRepository):
         return await self.find_by_shop_no(shop_no)
 
     async def soft_delete(self, shop_no: int) -> bool:
-        """상점 소프트 삭제"""
+        """
+        상점 소프트 삭제
+
+        deleted_at IS NULL 조건을 포함한 단일 UPDATE이므로
+        동시 삭제 요청이 와도 한 쪽만 성공합니다 (TOCTOU 방지).
+        """
         query = """
                 UPDATE shops
                 SET deleted_at = %s
-                WHERE shop_no = %s \
+                WHERE shop_no = %s AND deleted_at IS NULL \
                 """
         rows_affected = await self._execute(query, (datetime.now(), shop_no))
 
@@ -248,20 +289,21 @@ class ShopRepository(BaseRepository):
 
         return success
 
-    async def restore(self, shop_no: int) -> bool:
-        """삭제된 상점 복구"""
+    async def restore(self, shop_no: int) -> Optional[ShopEntity]:
+        """삭제된 상점 복구 (복구된 상점 반환, 없거나 이미 활성화된 경우 None)"""
         query = """
                 UPDATE shops
                 SET deleted_at = NULL
-                WHERE shop_no = %s \
+                WHERE shop_no = %s AND deleted_at IS NOT NULL \
                 """
-        rows_affected = await self._execute(query, (shop_no,))
+        # UPDATE와 결과 조회를 한 연결로 묶어 재조회 왕복을 줄입니다
+        async with transaction():
+            rows_affected = await self._execute(query, (shop_no,))
+            if rows_affected == 0:
+                return None
 
-        success = rows_affected > 0
-        if success:
             logger.info(f"Shop restored - shop_no: {shop_no}")
-
-        return success
+            return await self.find_by_shop_no(shop_no)
 
     async def hard_delete(self, shop_no: int) -> bool:
         """상점 완전 삭제"""
@@ -297,32 +339,32 @@ class ShopRepository(BaseRepository):
 
         return row['count'] > 0 if row else False
 
-    async def update_status(self, shop_no: int, shop_status: ShopStatus) -> bool:
-        """상점 상태 변경"""
+    async def update_status(self, shop_no: int, shop_status: ShopStatus) -> Optional[ShopEntity]:
+        """상점 상태 변경 (변경된 상점 반환, 없으면 None)"""
         query = """
                 UPDATE shops
                 SET shop_status = %s
                 WHERE shop_no = %s \
                 """
-        rows_affected = await self._execute(query, (shop_status.value, shop_no))
+        async with transaction():
+            rows_affected = await self._execute(query, (shop_status.value, shop_no))
+            if rows_affected == 0:
+                return None
 
-        success = rows_affected > 0
-        if success:
             logger.info(f"Shop status updated - shop_no: {shop_no}, status: {shop_status.value}")
+            return await self.find_by_shop_no(shop_no)
 
-        return success
-
-    async def toggle_display(self, shop_no: int) -> bool:
-        """노출 여부 토글"""
+    async def toggle_display(self, shop_no: int) -> Optional[ShopEntity]:
+        """노출 여부 토글 (토글된 상점 반환, 없으면 None)"""
         query = """
                 UPDATE shops
                 SET use_display = CASE WHEN use_display = 'T' THEN 'F' ELSE 'T' END
                 WHERE shop_no = %s \
                 """
-        rows_affected = await self._execute(query, (shop_no,))
+        async with transaction():
+            rows_affected = await self._execute(query, (shop_no,))
+            if rows_affected == 0:
+                return None
 
-        success = rows_affected > 0
-        if success:
             logger.info(f"Shop display toggled - shop_no: {shop_no}")
-
-        return success
\ No newline at end of file
+            return await self.find_by_shop_no(shop_no)
\ No newline at end of file
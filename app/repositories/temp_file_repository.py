@@ -48,14 +48,16 @@ class TempFileRepository(BaseRepository):
             self,
             file_id: int,
             uploader_id: int,
-            expires_at: datetime
+            expires_in_hours: int = 24
     ) -> TempFileEntity:
-        """임시 파일 생성"""
+        """임시 파일 생성 (만료 시각은 DB 서버 시계 기준으로 계산)"""
+        # 만료 시각을 DB에서 계산하여 앱 서버 간 시계 오차를 제거하고
+        # find_expired/cleanup_expired의 NOW() 비교와 같은 시계를 사용
         query = """
                 INSERT INTO TEMP_files (file_id, uploader_id, expires_at)
-                VALUES (%s, %s, %s) \
+                VALUES (%s, %s, NOW() + INTERVAL %s HOUR) \
                 """
-        temp_file_id = await self._execute(query, (file_id, uploader_id, expires_at))
+        temp_file_id = await self._execute(query, (file_id, uploader_id, expires_in_hours))
 
         logger.info(f"Temp file created - ID: {temp_file_id}, file: {file_id}, uploader: {uploader_id}")
 
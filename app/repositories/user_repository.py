@@ -14,6 +14,14 @@ class UserRepository(BaseRepository):
     UserRepositoryProtocol을 구현하며, 사용자 데이터에 대한 모든 데이터베이스 작업을 담당합니다.
     """
 
+    # 허용된 업데이트 필드 화이트리스트 (SQL Injection 방지, 클래스 로드 시 1회 구성)
+    ALLOWED_UPDATE_FIELDS = frozenset({
+        'email', 'username', 'password_hash', 'is_admin', 'is_active'
+    })
+
+    # 필드별 SET 절 조각 (클래스 로드 시 1회 생성 — 호출마다 f-string 포맷 제거)
+    _SET_FRAGMENTS = {field: f"{field} = %s" for field in ALLOWED_UPDATE_FIELDS}
+
     def _to_entity(self, row: Optional[dict]) -> Optional[UserEntity]:
         """
         데이터베이스 row를 UserEntity로 변환
@@ -80,6 +88,23 @@ class UserRepository(BaseRepository):
         row = await self._fetch_one(query, (username,))
         return self._to_entity(row)
 
+    async def check_conflicts(self, email: str, username: str) -> set:
+        """
+        이메일/사용자명 충돌 확인
+
+        두 번의 조회 대신 UNION ALL 한 쿼리로 어느 쪽이 충돌하는지 확인합니다.
+
+        Returns:
+            set: {'email', 'username'}의 부분집합 (충돌하는 항목만 포함)
+        """
+        query = """
+            SELECT 'email' AS field FROM DUAL WHERE EXISTS (SELECT 1 FROM users WHERE email = %s)
+            UNION ALL
+            SELECT 'username' AS field FROM DUAL WHERE EXISTS (SELECT 1 FROM users WHERE username = %s)
+        """
+        rows = await self._fetch_all(query, (email, username))
+        return {row['field'] for row in rows}
+
     async def find_all(
         self,
         skip: int = 0,
@@ -162,22 +187,19 @@ class UserRepository(BaseRepository):
         if not fields:
             return await self.find_by_id(user_id)
 
-        # 허용된 필드 화이트리스트 (SQL Injection 방지)
-        ALLOWED_UPDATE_FIELDS = {
-            'email', 'username', 'password_hash', 'is_admin', 'is_active'
-        }
+        # 필드명 검증: 차집합 한 번으로 전체 검사 (필드별 멤버십 비교 제거)
+        extra = fields.keys() - self.ALLOWED_UPDATE_FIELDS
+        if extra:
+            extra_fields = ', '.join(sorted(extra))
+            logger.warning(f"Attempted to update disallowed field: {extra_fields}")
+            raise ValueError(f"허용되지 않은 필드입니다: {extra_fields}")
 
         # UPDATE 쿼리 동적 생성
         update_fields = []
         params = []
 
         for field, value in fields.items():
-            # 필드명 검증
-            if field not in ALLOWED_UPDATE_FIELDS:
-                logger.warning(f"Attempted to update disallowed field: {field}")
-                raise ValueError(f"허용되지 않은 필드입니다: {field}")
-
-            update_fields.append(f"{field} = %s")
+            update_fields.append(self._SET_FRAGMENTS[field])
             params.append(value)
 
         # updated_at은 항상 업데이트
@@ -82,6 +82,12 @@ class ShopListResponse(BaseModel):
     total_pages: int
 
 
+class MyShopListResponse(BaseModel):
+    """내 상점 목록 응답 (커서 페이징)"""
+    shops: list[ShopResponse]
+    next_cursor: Optional[int] = None
+
+
 class ShopStatusUpdate(BaseModel):
     """상점 상태 변경 요청"""
     shop_status: ShopStatus
\ No newline at end of file
@@ -4,6 +4,12 @@ from datetime import datetime
 import re
 
 
+# 검증용 정규식 (모듈 로드 시 1회 컴파일 — re.match/search의 호출당 캐시 조회 제거)
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+
 class UserCreate(BaseModel):
     """사용자 생성 요청 스키마"""
     email: EmailStr = Field(..., description="이메일 주소")
@@ -15,7 +21,7 @@ class UserCreate(BaseModel):
     @classmethod
     def validate_username(cls, v):
         """사용자명 검증"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _USERNAME_RE.match(v):
             raise ValueError('사용자명은 영문, 숫자, _, - 만 사용 가능합니다')
         return v
 
@@ -23,9 +29,9 @@ class UserCreate(BaseModel):
     @classmethod
     def validate_password(cls, v):
         """비밀번호 검증"""
-        if not re.search(r'[A-Za-z]', v):
+        if not _HAS_LETTER_RE.search(v):
             raise ValueError('비밀번호는 최소 1개의 영문자를 포함해야 합니다')
-        if not re.search(r'\d', v):
+        if not _HAS_DIGIT_RE.search(v):
             raise ValueError('비밀번호는 최소 1개의 숫자를 포함해야 합니다')
         return v
 
@@ -88,7 +94,7 @@ class UserUpdate(BaseModel):
     def validate_username(cls, v):
         """사용자명 검증"""
         if v is not None:
-            if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+            if not _USERNAME_RE.match(v):
                 raise ValueError('사용자명은 영문, 숫자, _, - 만 사용 가능합니다')
         return v
 
@@ -97,9 +103,9 @@ class UserUpdate(BaseModel):
     def validate_password(cls, v):
         """비밀번호 검증"""
         if v is not None:
-            if not re.search(r'[A-Za-z]', v):
+            if not _HAS_LETTER_RE.search(v):
                 raise ValueError('비밀번호는 최소 1개의 영문자를 포함해야 합니다')
-            if not re.search(r'\d', v):
+            if not _HAS_DIGIT_RE.search(v):
                 raise ValueError('비밀번호는 최소 1개의 숫자를 포함해야 합니다')
         return v
 
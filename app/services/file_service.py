@@ -2,13 +2,25 @@
 File service - Business logic for file operations
 app/services/file_service.py
 """
+import hashlib
 import os
+import time
 import uuid
 import aiofiles
 import filetype
+
+try:
+    # BLAKE3: SIMD 기반으로 SHA-256보다 수 배 빠른 해시
+    # content_hash는 서명이 아닌 dedup/무결성 용도이므로 암호학적 서명 요건이 없음
+    from blake3 import blake3 as _content_hasher
+except ImportError:  # pragma: no cover - blake3 미설치 환경 fallback
+    from functools import partial
+    _content_hasher = partial(hashlib.sha256, usedforsecurity=False)
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import HTTPException, status, UploadFile
 from app.domain.entities.file import FileEntity, PostAttachmentEntity, TempFileEntity
 from app.domain.entities.user import UserEntity
@@ -19,6 +31,71 @@ from app.domain.interfaces.file_repository import (
 )
 from app.core.logging import logger
 from app.core.config import settings
+from app.db.database import transaction
+
+
+# Magic bytes 검사용 matcher 부분집합 (모듈 로드 시 1회 구성)
+# filetype.guess()는 폰트/오디오 등 ~80개 matcher를 전부 순회하지만,
+# _validate_mime_type이 허용하는 것은 이미지/문서/압축(zip, rar, 7z, pdf)/동영상뿐입니다.
+# 문서 matcher(docx 등 zip 기반)가 Zip matcher보다 먼저 오도록 순서를 유지합니다.
+ALLOWED_MATCHERS = (
+    tuple(filetype.image_matchers)
+    + tuple(filetype.video_matchers)
+    + tuple(filetype.document_matchers)
+    + tuple(
+        m for m in filetype.archive_matchers
+        if m.mime in (
+            'application/zip',
+            'application/x-rar-compressed',
+            'application/x-7z-compressed',
+            'application/pdf',
+        )
+    )
+)
+
+# 순수 접두사 시그니처 fast path (모듈 로드 시 1회 구성)
+# 첫 바이트로 버킷을 찾은 뒤 startswith 한 번이면 판별되는 포맷은
+# matcher 전체 순회 없이 즉시 반환합니다. 오프셋 검사가 필요한 포맷
+# (webp/동영상)과 zip 계열(docx 등과 구분 필요)은 filetype 폴백에 맡깁니다.
+_PREFIX_SIGNATURES: dict = {}
+for _sig, _mime in (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'BM', 'image/bmp'),
+    (b'%PDF', 'application/pdf'),
+    (b'Rar!\x1a\x07', 'application/x-rar-compressed'),
+    (b'7z\xbc\xaf\x27\x1c', 'application/x-7z-compressed'),
+):
+    _PREFIX_SIGNATURES.setdefault(_sig[0], []).append((_sig, _mime))
+del _sig, _mime
+
+
+@lru_cache(maxsize=32)
+def _ensure_upload_subdir(path_str: str) -> Path:
+    """업로드 하위 디렉터리 생성 (월별로 프로세스당 1회만 mkdir 수행)"""
+    path = Path(path_str)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# 업로드 스트리밍 복사 단위 (스풀 버퍼 -> 디스크)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Magic bytes 판별에 필요한 헤더 길이 (filetype은 앞부분 수백 바이트만 검사)
+UPLOAD_HEADER_SIZE = 8192
+
+# FileEntity 메타데이터 캐시 설정 (프로세스 로컬)
+# 인기 첨부파일(썸네일 등)의 반복 조회를 DB 왕복 없이 처리합니다.
+FILE_CACHE_MAX_SIZE = 10_000
+FILE_CACHE_TTL_SECONDS = 30.0
+
+# file_id -> (저장 시각, FileEntity) TTL LRU 캐시
+# FileService는 요청마다 새로 생성되므로 (get_file_service 의존성)
+# 캐시는 post_service/shop_service처럼 모듈 수준에 둬야 요청을 넘어 살아남습니다.
+# 이벤트 루프 단일 스레드에서만 접근하므로 별도 락은 필요 없습니다.
+_file_cache: OrderedDict[int, tuple[float, "FileEntity"]] = OrderedDict()
 
 
 class FileService:
@@ -40,6 +117,27 @@ class FileService:
         self.upload_dir = Path(settings.UPLOAD_DIR)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
 
+    async def _get_file(self, file_id: int) -> Optional[FileEntity]:
+        """ID로 파일 조회 (30초 TTL LRU 캐시 경유, 캐시는 모듈 공유)"""
+        entry = _file_cache.get(file_id)
+        if entry is not None:
+            cached_at, entity = entry
+            if time.monotonic() - cached_at < FILE_CACHE_TTL_SECONDS:
+                _file_cache.move_to_end(file_id)
+                return entity
+            del _file_cache[file_id]
+
+        entity = await self.file_repo.find_by_id(file_id)
+        if entity is not None:
+            _file_cache[file_id] = (time.monotonic(), entity)
+            if len(_file_cache) > FILE_CACHE_MAX_SIZE:
+                _file_cache.popitem(last=False)
+        return entity
+
+    def _invalidate_file_cache(self, file_id: int) -> None:
+        """파일 삭제/변경 시 캐시 무효화"""
+        _file_cache.pop(file_id, None)
+
     def _get_file_extension(self, filename: str) -> Optional[str]:
         """파일 확장자 추출 (Path Traversal 방지)"""
         # Path.name을 사용하여 디렉터리 경로 제거
@@ -57,7 +155,7 @@ class FileService:
         """
         # Path Traversal 공격 차단 (..)
         if '..' in filename:
-            logger.warning(f"Path traversal attempt detected: {filename}")
+            logger.warning("Path traversal attempt detected: %s", filename)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="잘못된 파일명입니다"
@@ -71,7 +169,7 @@ class FileService:
 
         # 빈 파일명 방지
         if not safe_filename or safe_filename in ['.', '..']:
-            logger.warning(f"Invalid filename: {filename}")
+            logger.warning("Invalid filename: %s", filename)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="잘못된 파일명입니다"
@@ -142,33 +240,43 @@ class FileService:
             HTTPException: 파일 타입 불일치 또는 지원하지 않는 파일
         """
         # Magic bytes로 실제 파일 타입 확인
-        kind = filetype.guess(content)
-
-        if kind is None:
+        # 1) 접두사 시그니처 fast path (첫 바이트 버킷 + startswith 1회)
+        actual_mime_type = None
+        if content:
+            for sig, mime in _PREFIX_SIGNATURES.get(content[0], ()):
+                if content.startswith(sig):
+                    actual_mime_type = mime
+                    break
+
+        # 2) 나머지는 허용 타입 matcher만 순회 (zip 계열/동영상 등)
+        if actual_mime_type is None:
+            kind = filetype.match(content, matchers=ALLOWED_MATCHERS)
+            if kind is not None:
+                actual_mime_type = kind.mime
+
+        if actual_mime_type is None:
             # 텍스트 파일은 magic bytes가 없을 수 있음
             if claimed_mime_type == 'text/plain':
                 logger.info("Text file detected (no magic bytes)")
                 return claimed_mime_type
             else:
-                logger.warning(f"Unknown file type - claimed: {claimed_mime_type}")
+                logger.warning("Unknown file type - claimed: %s", claimed_mime_type)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="파일 형식을 확인할 수 없습니다"
                 )
 
-        actual_mime_type = kind.mime
-        logger.info(f"File type validation - claimed: {claimed_mime_type}, actual: {actual_mime_type}")
+        logger.info("File type validation - claimed: %s, actual: %s", claimed_mime_type, actual_mime_type)
 
         # 실제 MIME 타입이 허용 목록에 있는지 검증
         self._validate_mime_type(actual_mime_type)
 
         # 클라이언트가 제공한 MIME과 실제 MIME이 크게 다른 경우 경고
-        claimed_category = claimed_mime_type.split('/')[0]
-        actual_category = actual_mime_type.split('/')[0]
-
-        if claimed_category != actual_category:
+        # split('/') 두 번 대신 '/'까지의 접두사 하나로 카테고리 비교 (할당 절감)
+        slash = claimed_mime_type.find('/')
+        if slash > 0 and not actual_mime_type.startswith(claimed_mime_type[:slash + 1]):
             logger.warning(
-                f"MIME type mismatch - claimed: {claimed_mime_type}, actual: {actual_mime_type}"
+                "MIME type mismatch - claimed: %s, actual: %s", claimed_mime_type, actual_mime_type
             )
             # 보안을 위해 실제 타입 사용
             return actual_mime_type
@@ -206,33 +314,54 @@ class FileService:
         # 게스트 사용자 처리
         uploader_id = current_user.id if current_user else settings.GUEST_USER_ID
 
-        logger.info(f"Uploading file - user: {'guest' if uploader_id == settings.GUEST_USER_ID else uploader_id}, filename: {file.filename}")
+        logger.info(
+            "Uploading file - user: %s, filename: %s",
+            'guest' if uploader_id == settings.GUEST_USER_ID else uploader_id,
+            file.filename
+        )
 
         # 파일명 정규화 (Path Traversal 방지)
         safe_original_filename = self._sanitize_filename(file.filename)
 
-        # 파일 읽기
-        content = await file.read()
-        file_size = len(content)
-
         # Magic bytes로 실제 파일 타입 검증 (MIME Spoofing 방지)
+        # 헤더만 읽어서 검증 - 전체 내용을 bytes로 복사하지 않음
         claimed_mime_type = file.content_type or 'application/octet-stream'
-        actual_mime_type = self._validate_file_content(content, claimed_mime_type)
+        header = await file.read(UPLOAD_HEADER_SIZE)
+        actual_mime_type = self._validate_file_content(header, claimed_mime_type)
+        await file.seek(0)
 
-        # 파일 크기 검증
         is_image = actual_mime_type.startswith('image/')
-        self._validate_file_size(file_size, is_image)
 
         # 저장 파일명 생성 (보안 강화된 메서드 사용)
         stored_filename = self._generate_stored_filename(safe_original_filename)
         file_extension = self._get_file_extension(safe_original_filename)
 
-        # 파일 저장
-        file_path = self.upload_dir / stored_filename
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
-
-        logger.info(f"File saved to disk - path: {file_path}")
+        # 파일 저장: UploadFile의 스풀 버퍼에서 청크 단위로 스트리밍 복사
+        # - 전체 내용을 메모리에 중복 버퍼링하지 않음 (대용량 업로드 메모리 절반)
+        # - 해시 계산/크기 검증을 같은 패스에 포함 (두 번째 순회 없음)
+        # - 숨김 임시 파일에 쓴 뒤 os.replace로 원자적 공개
+        hasher = _content_hasher()
+        file_size = 0
+        # 월별(YYYYMM) 하위 디렉터리에 샤딩 저장
+        # 단일 평면 디렉터리가 수만 엔트리로 커지면 readdir/lookup이 급격히 느려짐
+        dest_dir = _ensure_upload_subdir(str(self.upload_dir / datetime.now().strftime('%Y%m')))
+        file_path = dest_dir / stored_filename
+        part_path = dest_dir / f".{stored_filename}.part"
+        try:
+            async with aiofiles.open(part_path, 'wb') as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    self._validate_file_size(file_size, is_image)
+                    hasher.update(chunk)
+                    await f.write(chunk)
+            os.replace(part_path, file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        content_hash = hasher.hexdigest()
+
+        logger.info("File saved to disk - path: %s", file_path)
 
         # DB에 파일 정보 저장 (검증된 실제 MIME 타입 사용)
         file_entity = await self.file_repo.create(
@@ -244,20 +373,20 @@ class FileService:
             file_extension=file_extension,
             uploader_id=uploader_id,
             upload_ip=upload_ip,
-            is_public=is_public
+            is_public=is_public,
+            content_hash=content_hash
         )
 
-        # 임시 파일로 등록 (24시간 후 만료)
+        # 임시 파일로 등록 (24시간 후 만료, 만료 시각은 DB에서 계산)
         if is_temp:
-            expires_at = datetime.now() + timedelta(hours=24)
-            await self.temp_repo.create(
+            temp_file = await self.temp_repo.create(
                 file_id=file_entity.id,
                 uploader_id=uploader_id,
-                expires_at=expires_at
+                expires_in_hours=24
             )
-            logger.info(f"Registered as temp file - expires at: {expires_at}")
+            logger.info("Registered as temp file - expires at: %s", temp_file.expires_at)
 
-        logger.info(f"File uploaded successfully - ID: {file_entity.id}")
+        logger.info("File uploaded successfully - ID: %s", file_entity.id)
         return file_entity
 
     async def attach_files_to_post(
@@ -282,40 +411,43 @@ class FileService:
         Returns:
             List[PostAttachmentEntity]: 첨부된 파일 목록
         """
-        logger.info(f"Attaching files to post - post: {post_id}, files: {file_ids}")
+        logger.info("Attaching files to post - post: %s, files: %s", post_id, file_ids)
 
         attachments = []
         first_image_id = None
 
-        for idx, file_id in enumerate(file_ids):
-            # 파일 존재 확인
-            file_entity = await self.file_repo.find_by_id(file_id)
-            if not file_entity:
-                logger.warning(f"File not found - ID: {file_id}")
-                continue
-
-            # 임시 파일 테이블에서 제거
-            await self.temp_repo.delete_by_file_id(file_id)
-
-            # 첨부파일 연결 생성
-            attachment = await self.attachment_repo.create(
-                post_id=post_id,
-                file_id=file_id,
-                display_order=idx,
-                is_thumbnail=False  # 나중에 첫 번째 이미지를 썸네일로 설정
-            )
-            attachments.append(attachment)
+        # 전체 첨부 작업을 하나의 연결/트랜잭션으로 묶음
+        # (파일 수와 무관하게 COMMIT 1회, 부분 실패 시 전체 ROLLBACK)
+        async with transaction():
+            for idx, file_id in enumerate(file_ids):
+                # 파일 존재 확인
+                file_entity = await self._get_file(file_id)
+                if not file_entity:
+                    logger.warning("File not found - ID: %s", file_id)
+                    continue
+
+                # 임시 파일 테이블에서 제거
+                await self.temp_repo.delete_by_file_id(file_id)
+
+                # 첨부파일 연결 생성
+                attachment = await self.attachment_repo.create(
+                    post_id=post_id,
+                    file_id=file_id,
+                    display_order=idx,
+                    is_thumbnail=False  # 나중에 첫 번째 이미지를 썸네일로 설정
+                )
+                attachments.append(attachment)
 
-            # 첫 번째 이미지 찾기
-            if first_image_id is None and file_entity.is_image():
-                first_image_id = file_id
+                # 첫 번째 이미지 찾기
+                if first_image_id is None and file_entity.is_image():
+                    first_image_id = file_id
 
-        # 첫 번째 이미지를 썸네일로 설정
-        if first_image_id:
-            await self.attachment_repo.set_thumbnail(post_id, first_image_id)
-            logger.info(f"Set thumbnail - post: {post_id}, file: {first_image_id}")
+            # 첫 번째 이미지를 썸네일로 설정
+            if first_image_id:
+                await self.attachment_repo.set_thumbnail(post_id, first_image_id)
+                logger.info("Set thumbnail - post: %s, file: %s", post_id, first_image_id)
 
-        logger.info(f"Attached {len(attachments)} files to post: {post_id}")
+        logger.info("Attached %d files to post: %s", len(attachments), post_id)
         return attachments
 
     async def get_post_attachments(self, post_id: int) -> List[PostAttachmentEntity]:
@@ -351,9 +483,9 @@ class FileService:
             tuple[Path, str]: (파일 경로, 원본 파일명)
         """
         # 파일 존재 확인
-        file_entity = await self.file_repo.find_by_id(file_id)
+        file_entity = await self._get_file(file_id)
         if not file_entity:
-            logger.warning(f"File not found - ID: {file_id}")
+            logger.warning("File not found - ID: %s", file_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="파일을 찾을 수 없습니다"
@@ -364,7 +496,7 @@ class FileService:
         is_admin = current_user.is_admin if current_user else False
 
         if not file_entity.can_access(user_id, is_admin):
-            logger.warning(f"File access denied - file: {file_id}, user: {user_id}")
+            logger.warning("File access denied - file: %s, user: %s", file_id, user_id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="파일에 접근할 권한이 없습니다"
@@ -373,15 +505,11 @@ class FileService:
         # 다운로드 횟수 증가
         await self.file_repo.increment_download_count(file_id)
 
+        # exists() 선확인은 하지 않음 (TOCTOU 방지 + stat 1회 절약)
+        # 디스크에 파일이 없는 경우는 라우터에서 FileNotFoundError를 404로 변환
         file_path = Path(file_entity.file_path)
-        if not file_path.exists():
-            logger.error(f"File not found on disk - path: {file_path}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="파일을 찾을 수 없습니다"
-            )
 
-        logger.info(f"File downloaded - ID: {file_id}")
+        logger.info("File downloaded - ID: %s", file_id)
         return file_path, file_entity.original_filename
 
     async def delete_file(
@@ -406,12 +534,12 @@ class FileService:
         Returns:
             FileEntity: 삭제된 파일 엔티티
         """
-        logger.info(f"Deleting file - ID: {file_id}, user: {current_user.id}, hard: {hard_delete}")
+        logger.info("Deleting file - ID: %s, user: %s, hard: %s", file_id, current_user.id, hard_delete)
 
         # 파일 존재 확인
-        file_entity = await self.file_repo.find_by_id(file_id)
+        file_entity = await self._get_file(file_id)
         if not file_entity:
-            logger.warning(f"File not found - ID: {file_id}")
+            logger.warning("File not found - ID: %s", file_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="파일을 찾을 수 없습니다"
@@ -419,22 +547,24 @@ class FileService:
 
         # 권한 확인
         if not file_entity.can_delete(current_user.id, current_user.is_admin):
-            logger.warning(f"File delete permission denied - file: {file_id}, user: {current_user.id}")
+            logger.warning("File delete permission denied - file: %s, user: %s", file_id, current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="파일을 삭제할 권한이 없습니다"
             )
 
         if hard_delete:
-            # 실제 파일 삭제
+            # 실제 파일 삭제 (exists() 선확인 없이 바로 unlink - stat 1회 절약)
             file_path = Path(file_entity.file_path)
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"File deleted from disk - path: {file_path}")
+            file_path.unlink(missing_ok=True)
+            logger.info("File deleted from disk - path: %s", file_path)
         else:
             # Soft Delete
             await self.file_repo.soft_delete(file_id)
-            logger.info(f"File soft deleted - ID: {file_id}")
+            logger.info("File soft deleted - ID: %s", file_id)
+
+        # 삭제된 파일은 캐시에서 제거
+        self._invalidate_file_cache(file_id)
 
         return file_entity
 
@@ -453,21 +583,21 @@ class FileService:
         deleted_count = 0
         for temp_file in expired_files:
             if temp_file.file:
-                # 실제 파일 삭제
+                # 실제 파일 삭제 (exists() 선확인 없이 바로 unlink)
                 file_path = Path(temp_file.file.file_path)
-                if file_path.exists():
-                    try:
-                        file_path.unlink()
-                        logger.info(f"Expired temp file deleted - path: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete file - path: {file_path}, error: {e}")
+                try:
+                    file_path.unlink(missing_ok=True)
+                    logger.info("Expired temp file deleted - path: %s", file_path)
+                except Exception as e:
+                    logger.error("Failed to delete file - path: %s, error: %s", file_path, e)
 
                 # DB에서 파일 삭제
                 await self.file_repo.soft_delete(temp_file.file_id)
+                self._invalidate_file_cache(temp_file.file_id)
 
             # 임시 파일 레코드 삭제
             await self.temp_repo.delete(temp_file.id)
             deleted_count += 1
 
-        logger.info(f"Cleaned up {deleted_count} expired temp files")
+        logger.info("Cleaned up %d expired temp files", deleted_count)
         return deleted_count
\ No newline at end of file
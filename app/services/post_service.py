@@ -2,6 +2,11 @@
 Post service - Business logic for post operations
 app/services/post_service.py
 """
+import asyncio
+import os
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from fastapi import HTTPException, status
 from app.domain.entities.post import PostEntity
@@ -11,7 +16,187 @@ from app.schemas.post import PostCreate, PostUpdate
 from app.core.logging import logger
 from app.core.config import settings
 from app.core.security import hash_password, verify_password, generate_random_password
-import math
+from app.db.database import execute_many
+
+# 게스트 작성자 ID (매 요청 settings 프록시 속성 조회를 피하기 위해 모듈 로컬로 바인딩)
+_GUEST_ID: int = settings.GUEST_USER_ID
+
+# 정렬 파라미터 화이트리스트
+# list_posts 진입 시점에 정규화해 잘못된 값이 repository까지 내려가지 않게 하고,
+# 동일한 목록 요청이 표기 차이로 다른 캐시 키로 갈라지는 것을 막습니다.
+_ALLOWED_SORT = frozenset({"id", "title", "created_at", "updated_at", "view_count", "like_count"})
+
+# 고정 메시지 예외 (모듈 로드 시 1회 생성해 공유)
+# 에러 경로마다 HTTPException + detail 문자열을 새로 만들 필요가 없습니다.
+# Starlette는 같은 인스턴스를 동시에 raise해도 안전합니다 (생성 후 불변).
+_POST_NOT_FOUND = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="게시글을 찾을 수 없습니다"
+)
+_PIN_ADMIN_ONLY = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="고정 게시글은 관리자만 생성할 수 있습니다"
+)
+_DELETED_NOT_EDITABLE = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="삭제된 게시글은 수정할 수 없습니다"
+)
+_GUEST_UPDATE_PASSWORD_REQUIRED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="게스트 게시글 수정을 위해서는 비밀번호가 필요합니다"
+)
+_GUEST_DELETE_PASSWORD_REQUIRED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="게스트 게시글 삭제를 위해서는 비밀번호가 필요합니다"
+)
+_PASSWORD_MISMATCH = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="비밀번호가 일치하지 않습니다"
+)
+_UPDATE_OWNER_ONLY = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="본인이 작성한 게시글만 수정할 수 있습니다"
+)
+_DELETE_OWNER_ONLY = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="본인이 작성한 게시글만 삭제할 수 있습니다"
+)
+_LOCKED_ADMIN_ONLY = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="잠긴 게시글은 관리자만 수정할 수 있습니다"
+)
+_ALREADY_DELETED = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="이미 삭제된 게시글입니다"
+)
+_ALREADY_ACTIVE = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="이미 활성화된 게시글입니다"
+)
+
+
+# bcrypt 해싱 전용 스레드 풀 (코어 수만큼)
+# bcrypt는 호출당 수십~수백 ms의 CPU 작업이라 이벤트 루프에서 직접 돌리면
+# 다른 요청까지 전부 멈춥니다. FastAPI 기본 스레드 풀(동기 의존성도 공유)과
+# 분리된 풀에서 실행해 해싱이 다른 동기 작업을 밀어내지 않게 합니다.
+# bcrypt 4.x+는 Rust 기반으로 해싱 중 GIL을 해제하므로 프로세스 풀 없이
+# 스레드만으로도 N코어에서 N배 병렬 처리가 됩니다 (피클링/포크 오버헤드 없음).
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="bcrypt"
+)
+
+# 조회수 증분 버퍼 (프로세스 로컬)
+# 읽기마다 UPDATE 1회를 날리는 대신 메모리에 적립했다가 주기적으로 일괄 반영합니다.
+# 인기 게시글의 행 잠금 경합을 없애고 UPDATE 수를 크게 줄입니다.
+_view_buffer: Counter = Counter()
+VIEW_FLUSH_INTERVAL_SECONDS = 2.0
+
+
+# 인기 게시글 캐시 (프로세스 로컬, post_id -> (저장 시각, PostEntity))
+# 트래픽은 소수의 인기 게시글에 몰리므로 짧은 TTL 캐시만으로도
+# 반복 조회의 DB 왕복 대부분을 없앨 수 있습니다. 쓰기 경로에서 무효화합니다.
+POST_CACHE_MAX_SIZE = 1024
+POST_CACHE_TTL_SECONDS = 30.0
+_post_cache: OrderedDict[int, tuple[float, PostEntity]] = OrderedDict()
+
+
+def _post_cache_get(post_id: int) -> Optional[PostEntity]:
+    """캐시에서 게시글 조회 (TTL 만료 시 제거 후 None)"""
+    entry = _post_cache.get(post_id)
+    if entry is None:
+        return None
+    cached_at, post = entry
+    if time.monotonic() - cached_at >= POST_CACHE_TTL_SECONDS:
+        del _post_cache[post_id]
+        return None
+    _post_cache.move_to_end(post_id)
+    return post
+
+
+def _post_cache_put(post_id: int, post: PostEntity) -> None:
+    """게시글을 캐시에 저장 (용량 초과 시 LRU 제거)"""
+    _post_cache[post_id] = (time.monotonic(), post)
+    if len(_post_cache) > POST_CACHE_MAX_SIZE:
+        _post_cache.popitem(last=False)
+
+
+def _invalidate_post_cache(post_id: int) -> None:
+    """게시글 변경/삭제 시 캐시 무효화"""
+    _post_cache.pop(post_id, None)
+
+
+# 게시글 목록 캐시 (프로세스 로컬, 필터 튜플 -> (저장 시각, 응답 dict))
+# 기본 정렬의 첫 페이지가 압도적으로 자주 요청되므로 아주 짧은 TTL만으로도
+# 동일 필터 요청의 find_all + COUNT(*) 왕복을 대부분 제거할 수 있습니다.
+# 필터 조합을 역추적할 수 없으므로 쓰기 경로에서는 전체를 비웁니다.
+LIST_CACHE_MAX_SIZE = 256
+LIST_CACHE_TTL_SECONDS = 5.0
+_list_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+
+
+def _list_cache_get(key: tuple) -> Optional[dict]:
+    """캐시에서 목록 응답 조회 (TTL 만료 시 제거 후 None)"""
+    entry = _list_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, result = entry
+    if time.monotonic() - cached_at >= LIST_CACHE_TTL_SECONDS:
+        del _list_cache[key]
+        return None
+    _list_cache.move_to_end(key)
+    return result
+
+
+def _list_cache_put(key: tuple, result: dict) -> None:
+    """목록 응답을 캐시에 저장 (용량 초과 시 LRU 제거)"""
+    _list_cache[key] = (time.monotonic(), result)
+    if len(_list_cache) > LIST_CACHE_MAX_SIZE:
+        _list_cache.popitem(last=False)
+
+
+def _clear_list_cache() -> None:
+    """게시글 생성/수정/삭제 시 목록 캐시 전체 무효화"""
+    _list_cache.clear()
+
+
+def buffer_view_increment(post_id: int) -> None:
+    """조회수 증가를 메모리 버퍼에 적립 (flush_view_counts가 일괄 반영)"""
+    _view_buffer[post_id] += 1
+
+
+async def flush_view_counts() -> int:
+    """
+    버퍼된 조회수 증분을 하나의 배치 UPDATE로 DB에 반영
+
+    Returns:
+        int: 반영된 게시글 수
+    """
+    if not _view_buffer:
+        return 0
+
+    snapshot = dict(_view_buffer)
+    _view_buffer.clear()
+    try:
+        await execute_many(
+            "UPDATE posts SET view_count = view_count + %s WHERE id = %s",
+            [(count, post_id) for post_id, count in snapshot.items()]
+        )
+    except Exception as e:
+        # 실패 시 증분을 버퍼에 되살려 다음 flush에서 재시도
+        _view_buffer.update(snapshot)
+        logger.error("Failed to flush view counts - error: %s", e)
+        return 0
+
+    logger.debug("Flushed view counts for %s posts", len(snapshot))
+    return len(snapshot)
+
+
+async def view_count_flush_loop() -> None:
+    """주기적으로 flush_view_counts를 실행하는 백그라운드 루프 (startup에서 기동)"""
+    while True:
+        await asyncio.sleep(VIEW_FLUSH_INTERVAL_SECONDS)
+        await flush_view_counts()
 
 
 class PostService:
@@ -56,19 +241,16 @@ class PostService:
             HTTPException: 권한 없음
         """
         # 게스트 사용자 처리
-        author_id = current_user.id if current_user else settings.GUEST_USER_ID
+        author_id = current_user.id if current_user else _GUEST_ID
         is_admin = current_user.is_admin if current_user else False
-        is_guest = (author_id == settings.GUEST_USER_ID)
+        is_guest = (author_id == _GUEST_ID)
 
-        logger.info(f"Creating post - user: {'guest' if is_guest else author_id}, title: {post_data.title}")
+        logger.info("Creating post - user: %s, title: %s", 'guest' if is_guest else author_id, post_data.title)
 
         # 비즈니스 규칙: 고정 게시글은 관리자만 생성 가능
         if post_data.is_pinned and not is_admin:
-            logger.warning(f"Non-admin user tried to create pinned post - user: {author_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="고정 게시글은 관리자만 생성할 수 있습니다"
-            )
+            logger.warning("Non-admin user tried to create pinned post - user: %s", author_id)
+            raise _PIN_ADMIN_ONLY
 
         # 비밀번호 처리 (게스트 게시글)
         plain_password = None
@@ -78,12 +260,15 @@ class PostService:
             if post_data.password:
                 # 사용자가 비밀번호를 입력한 경우
                 plain_password = post_data.password
-                hashed_password = hash_password(plain_password)
             else:
                 # 비밀번호 자동 생성
                 plain_password = generate_random_password(8)
-                hashed_password = hash_password(plain_password)
-                logger.info(f"Auto-generated password for guest post")
+                logger.info("Auto-generated password for guest post")
+
+            # CPU-bound bcrypt 해싱은 전용 풀에서 수행 (이벤트 루프 블로킹 방지)
+            hashed_password = await asyncio.get_running_loop().run_in_executor(
+                _HASH_POOL, hash_password, plain_password
+            )
 
         # Repository 호출
         post = await self.repo.create(
@@ -94,7 +279,9 @@ class PostService:
             password=hashed_password
         )
 
-        logger.info(f"Post created successfully - ID: {post.id}, author: {author_id}")
+        _clear_list_cache()
+
+        logger.info("Post created successfully - ID: %s, author: %s", post.id, author_id)
 
         # 게스트 게시글의 경우 평문 비밀번호 반환 (응답에서 사용)
         return post, plain_password if is_guest else None
@@ -123,29 +310,28 @@ class PostService:
         Raises:
             HTTPException: 게시글 없음 또는 접근 권한 없음
         """
-        post = await self.repo.find_by_id_with_author(post_id)
+        # 인기 게시글은 캐시에서 바로 반환 (권한 검사는 캐시 히트에도 수행)
+        post = _post_cache_get(post_id)
+        if post is None:
+            post = await self.repo.find_by_id_with_author(post_id)
+            if post:
+                _post_cache_put(post_id, post)
 
         if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
         # 비즈니스 규칙: 삭제된 게시글은 관리자만 조회 가능
         if post.is_deleted:
             if not current_user or not current_user.is_admin:
-                logger.warning(f"Unauthorized access to deleted post - ID: {post_id}")
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="게시글을 찾을 수 없습니다"
-                )
+                logger.warning("Unauthorized access to deleted post - ID: %s", post_id)
+                raise _POST_NOT_FOUND
 
-        # 조회수 증가 (삭제된 게시글은 제외)
+        # 조회수 증가는 즉시 UPDATE하지 않고 버퍼에 적립 (주기적 일괄 flush)
         if increment_view and not post.is_deleted:
-            await self.repo.increment_view_count(post_id)
+            buffer_view_increment(post_id)
 
-        logger.info(f"Post retrieved - ID: {post_id}")
+        logger.info("Post retrieved - ID: %s", post_id)
         return post
 
     async def list_posts(
@@ -184,6 +370,20 @@ class PostService:
         if include_deleted and (not current_user or not current_user.is_admin):
             include_deleted = False
 
+        # 정렬 파라미터 정규화 (캐시 키/쿼리 생성 전에 한 번만)
+        if sort_by not in _ALLOWED_SORT:
+            sort_by = "created_at"
+        sort_order = "asc" if sort_order.lower() == "asc" else "desc"
+
+        # 동일 필터 조합은 짧은 TTL 캐시에서 바로 반환
+        # (include_deleted는 관리자 전용 경로라 항상 최신 데이터를 조회)
+        cache_key = (page, page_size, search, author_id, is_pinned,
+                     include_deleted, sort_by, sort_order)
+        if not include_deleted:
+            cached = _list_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         offset = (page - 1) * page_size
 
         posts, total = await self.repo.find_all(
@@ -197,11 +397,12 @@ class PostService:
             sort_order=sort_order
         )
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 0
+        # 정수 올림 나눗셈 (float 경유 math.ceil보다 빠르고 큰 값에서도 정확)
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-        logger.info(f"Listed {len(posts)} posts (page {page}/{total_pages}, total: {total})")
+        logger.info("Listed %s posts (page %s/%s, total: %s)", len(posts), page, total_pages, total)
 
-        return {
+        result = {
             "posts": posts,
             "total": total,
             "page": page,
@@ -209,6 +410,11 @@ class PostService:
             "total_pages": total_pages
         }
 
+        if not include_deleted:
+            _list_cache_put(cache_key, result)
+
+        return result
+
     async def update_post(
             self,
             post_id: int,
@@ -235,88 +441,84 @@ class PostService:
         Raises:
             HTTPException: 권한 없음, 게시글 없음
         """
+        # repo를 지역 변수로 바인딩 (메서드 내 반복 속성 조회 제거)
+        repo = self.repo
         user_id = current_user.id if current_user else 0
         is_admin = current_user.is_admin if current_user else False
 
-        logger.info(f"Updating post - ID: {post_id}, by user: {user_id}")
+        logger.info("Updating post - ID: %s, by user: %s", post_id, user_id)
 
         # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
+        post = await repo.find_by_id(post_id)
         if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
         # 비즈니스 규칙: 삭제된 게시글은 수정 불가
         if post.is_deleted:
-            logger.warning(f"Cannot update deleted post - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="삭제된 게시글은 수정할 수 없습니다"
-            )
+            logger.warning("Cannot update deleted post - ID: %s", post_id)
+            raise _DELETED_NOT_EDITABLE
 
         # 게스트 게시글 비밀번호 검증
-        is_guest_post = (post.author_id == settings.GUEST_USER_ID)
+        is_guest_post = (post.author_id == _GUEST_ID)
         if is_guest_post:
             if not post_data.password:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="게스트 게시글 수정을 위해서는 비밀번호가 필요합니다"
-                )
+                raise _GUEST_UPDATE_PASSWORD_REQUIRED
 
-            if not post.password or not verify_password(post_data.password, post.password):
-                logger.warning(f"Invalid password for guest post - ID: {post_id}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="비밀번호가 일치하지 않습니다"
-                )
-            logger.info(f"Password verified for guest post - ID: {post_id}")
+            # bcrypt verify도 CPU-bound이므로 전용 풀에서 수행
+            # (post.password 부재 short-circuit은 executor 왕복 전에 처리)
+            if not post.password or not await asyncio.get_running_loop().run_in_executor(
+                    _HASH_POOL, verify_password, post_data.password, post.password
+            ):
+                logger.warning("Invalid password for guest post - ID: %s", post_id)
+                raise _PASSWORD_MISMATCH
+            logger.info("Password verified for guest post - ID: %s", post_id)
 
         # 비즈니스 규칙: 권한 체크 (인증된 사용자)
         elif not post.can_modify(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {user_id} tried to modify post {post_id}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="본인이 작성한 게시글만 수정할 수 있습니다"
+                "Permission denied - User %s tried to modify post %s", user_id, post_id
             )
+            raise _UPDATE_OWNER_ONLY
 
         # 비즈니스 규칙: 잠긴 게시글은 관리자만 수정 가능
         if post.is_locked and not is_admin:
-            logger.warning(f"Cannot update locked post - ID: {post_id}, user: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="잠긴 게시글은 관리자만 수정할 수 있습니다"
-            )
+            logger.warning("Cannot update locked post - ID: %s, user: %s", post_id, user_id)
+            raise _LOCKED_ADMIN_ONLY
 
         # 업데이트할 필드 준비
-        update_data = post_data.model_dump(exclude_unset=True)
+        # model_dump()는 전체 필드를 순회/복사하므로 사용하지 않고,
+        # 실제로 설정된 필드만 model_fields_set으로 골라냅니다.
+        # password는 검증 용도일 뿐 업데이트 대상이 아니므로 제외합니다.
+        changed_fields = post_data.model_fields_set - {'password'}
+
+        # 수정할 필드가 없으면 (비밀번호 검증만 수행한 경우) 현재 상태 반환
+        if not changed_fields:
+            logger.info("No fields to update - ID: %s", post_id)
+            return post
 
-        # password 필드 제거 (업데이트하지 않음)
-        if 'password' in update_data:
-            del update_data['password']
+        update_data = {field: getattr(post_data, field) for field in changed_fields}
 
         # 비즈니스 규칙: 고정/잠금 설정은 관리자만 가능
         if 'is_pinned' in update_data and not is_admin:
-            logger.warning(f"Non-admin tried to change pin status - user: {user_id}")
+            logger.warning("Non-admin tried to change pin status - user: %s", user_id)
             del update_data['is_pinned']
 
         if 'is_locked' in update_data and not is_admin:
-            logger.warning(f"Non-admin tried to change lock status - user: {user_id}")
+            logger.warning("Non-admin tried to change lock status - user: %s", user_id)
             del update_data['is_locked']
 
         # 수정할 필드가 없으면 현재 상태 반환
         if not update_data:
-            logger.info(f"No fields to update - ID: {post_id}")
+            logger.info("No fields to update - ID: %s", post_id)
             return post
 
         # Repository 업데이트 호출
-        updated_post = await self.repo.update(post_id, **update_data)
+        updated_post = await repo.update(post_id, **update_data)
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
-        logger.info(f"Post updated successfully - ID: {post_id}")
+        logger.info("Post updated successfully - ID: %s", post_id)
         return updated_post
 
     async def delete_post(
@@ -345,68 +547,63 @@ class PostService:
         Raises:
             HTTPException: 권한 없음, 게시글 없음
         """
+        # repo를 지역 변수로 바인딩 (메서드 내 반복 속성 조회 제거)
+        repo = self.repo
         user_id = current_user.id if current_user else 0
         is_admin = current_user.is_admin if current_user else False
 
-        logger.info(f"Deleting post - ID: {post_id}, by user: {user_id}, hard: {hard_delete}")
+        logger.info("Deleting post - ID: %s, by user: %s, hard: %s", post_id, user_id, hard_delete)
 
         # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
+        post = await repo.find_by_id(post_id)
         if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
         # 게스트 게시글 비밀번호 검증
-        is_guest_post = (post.author_id == settings.GUEST_USER_ID)
+        is_guest_post = (post.author_id == _GUEST_ID)
         if is_guest_post:
             if not password:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="게스트 게시글 삭제를 위해서는 비밀번호가 필요합니다"
-                )
+                raise _GUEST_DELETE_PASSWORD_REQUIRED
 
-            if not post.password or not verify_password(password, post.password):
-                logger.warning(f"Invalid password for guest post deletion - ID: {post_id}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="비밀번호가 일치하지 않습니다"
-                )
-            logger.info(f"Password verified for guest post deletion - ID: {post_id}")
+            # bcrypt verify도 CPU-bound이므로 전용 풀에서 수행
+            if not post.password or not await asyncio.get_running_loop().run_in_executor(
+                    _HASH_POOL, verify_password, password, post.password
+            ):
+                logger.warning("Invalid password for guest post deletion - ID: %s", post_id)
+                raise _PASSWORD_MISMATCH
+            logger.info("Password verified for guest post deletion - ID: %s", post_id)
 
         # 비즈니스 규칙: 권한 체크 (인증된 사용자)
         elif not post.can_delete(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {user_id} tried to delete post {post_id}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="본인이 작성한 게시글만 삭제할 수 있습니다"
+                "Permission denied - User %s tried to delete post %s", user_id, post_id
             )
+            raise _DELETE_OWNER_ONLY
 
         # 삭제 수행
         if hard_delete and is_admin:
             # Hard Delete (관리자 전용)
-            success = await self.repo.delete(post_id)
+            success = await repo.delete(post_id)
             if not success:
-                logger.error(f"Failed to delete post - ID: {post_id}")
+                logger.error("Failed to delete post - ID: %s", post_id)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="게시글 삭제 중 오류가 발생했습니다"
                 )
-            logger.info(f"Post hard deleted - ID: {post_id}")
+            logger.info("Post hard deleted - ID: %s", post_id)
         else:
             # Soft Delete (기본)
-            success = await self.repo.soft_delete(post_id)
+            # is_deleted = 0 조건이 포함된 단일 UPDATE이므로
+            # 동시 삭제 요청이 와도 한 쪽만 성공합니다
+            success = await repo.soft_delete(post_id)
             if not success:
-                logger.error(f"Failed to soft delete post - ID: {post_id}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="게시글 삭제 중 오류가 발생했습니다"
-                )
-            logger.info(f"Post soft deleted - ID: {post_id}")
+                logger.warning("Post already deleted - ID: %s", post_id)
+                raise _ALREADY_DELETED
+            logger.info("Post soft deleted - ID: %s", post_id)
+
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
         return post
 
@@ -426,38 +623,26 @@ class PostService:
         Raises:
             HTTPException: 이미 활성화된 경우, 게시글 없음
         """
-        logger.info(f"Restoring post - ID: {post_id}")
-
-        # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
-        if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
-
-        # 비즈니스 규칙: 이미 활성화된 경우
-        if not post.is_deleted:
-            logger.info(f"Post already active - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 활성화된 게시글입니다"
-            )
-
-        # 복구 수행
-        success = await self.repo.restore(post_id)
-        if not success:
-            logger.error(f"Failed to restore post - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="게시글 복구 중 오류가 발생했습니다"
-            )
-
-        # 복구된 게시글 조회
-        restored_post = await self.repo.find_by_id(post_id)
-
-        logger.info(f"Post restored successfully - ID: {post_id}")
+        # repo를 지역 변수로 바인딩 (메서드 내 반복 속성 조회 제거)
+        repo = self.repo
+        logger.info("Restoring post - ID: %s", post_id)
+
+        # 복구 수행 (복구된 게시글을 repository가 바로 반환)
+        # is_deleted = 1 조건이 포함된 단일 UPDATE라 존재 확인 SELECT가 필요 없고,
+        # 실패한 경우에만 한 번 조회해 404(없음)/400(이미 활성) 응답을 구분합니다
+        restored_post = await repo.restore(post_id)
+        if restored_post is None:
+            post = await repo.find_by_id(post_id)
+            if not post:
+                logger.warning("Post not found - ID: %s", post_id)
+                raise _POST_NOT_FOUND
+            logger.info("Post already active - ID: %s", post_id)
+            raise _ALREADY_ACTIVE
+
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
+
+        logger.info("Post restored successfully - ID: %s", post_id)
         return restored_post
 
     async def toggle_pin(self, post_id: int, current_user: UserEntity) -> PostEntity:
@@ -474,24 +659,18 @@ class PostService:
         Raises:
             HTTPException: 게시글 없음
         """
-        logger.info(f"Toggling pin - ID: {post_id}, by admin: {current_user.id}")
+        logger.info("Toggling pin - ID: %s, by admin: %s", post_id, current_user.id)
 
-        # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
-        if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
+        # 단일 UPDATE로 토글 (사전/사후 find_by_id 왕복 제거)
+        updated_post = await self.repo.toggle_pin(post_id)
+        if not updated_post:
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
-        # 고정/해제 토글
-        new_state = await self.repo.toggle_pin(post_id)
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
-        # 업데이트된 게시글 조회
-        updated_post = await self.repo.find_by_id(post_id)
-
-        logger.info(f"Post pin toggled - ID: {post_id}, is_pinned: {new_state}")
+        logger.info("Post pin toggled - ID: %s, is_pinned: %s", post_id, updated_post.is_pinned)
         return updated_post
 
     async def toggle_lock(self, post_id: int, current_user: UserEntity) -> PostEntity:
@@ -508,24 +687,18 @@ class PostService:
         Raises:
             HTTPException: 게시글 없음
         """
-        logger.info(f"Toggling lock - ID: {post_id}, by admin: {current_user.id}")
+        logger.info("Toggling lock - ID: %s, by admin: %s", post_id, current_user.id)
 
-        # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
-        if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
-
-        # 잠금/해제 토글
-        new_state = await self.repo.toggle_lock(post_id)
+        # 단일 UPDATE로 토글 (사전/사후 find_by_id 왕복 제거)
+        updated_post = await self.repo.toggle_lock(post_id)
+        if not updated_post:
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
-        # 업데이트된 게시글 조회
-        updated_post = await self.repo.find_by_id(post_id)
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
-        logger.info(f"Post lock toggled - ID: {post_id}, is_locked: {new_state}")
+        logger.info("Post lock toggled - ID: %s, is_locked: %s", post_id, updated_post.is_locked)
         return updated_post
 
     async def increment_like(self, post_id: int) -> PostEntity:
@@ -541,27 +714,17 @@ class PostService:
         Raises:
             HTTPException: 게시글 없음
         """
-        # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
-        if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
-
-        if post.is_deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
+        # 단일 UPDATE로 증가 (사전/사후 find_by_id 왕복 제거)
+        # 없거나 삭제된 게시글이면 None 반환
+        updated_post = await self.repo.increment_like_count(post_id)
+        if not updated_post:
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
-        await self.repo.increment_like_count(post_id)
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
-        # 업데이트된 게시글 조회
-        updated_post = await self.repo.find_by_id(post_id)
-
-        logger.info(f"Like count incremented - ID: {post_id}")
+        logger.info("Like count incremented - ID: %s", post_id)
         return updated_post
 
     async def decrement_like(self, post_id: int) -> PostEntity:
@@ -577,25 +740,15 @@ class PostService:
         Raises:
             HTTPException: 게시글 없음
         """
-        # 게시글 존재 확인
-        post = await self.repo.find_by_id(post_id)
-        if not post:
-            logger.warning(f"Post not found - ID: {post_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
-
-        if post.is_deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다"
-            )
-
-        await self.repo.decrement_like_count(post_id)
+        # 단일 UPDATE로 감소 (사전/사후 find_by_id 왕복 제거)
+        # 없거나 삭제된 게시글이면 None 반환
+        updated_post = await self.repo.decrement_like_count(post_id)
+        if not updated_post:
+            logger.warning("Post not found - ID: %s", post_id)
+            raise _POST_NOT_FOUND
 
-        # 업데이트된 게시글 조회
-        updated_post = await self.repo.find_by_id(post_id)
+        _invalidate_post_cache(post_id)
+        _clear_list_cache()
 
-        logger.info(f"Like count decremented - ID: {post_id}")
+        logger.info("Like count decremented - ID: %s", post_id)
         return updated_post
\ No newline at end of file
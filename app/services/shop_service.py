@@ -3,6 +3,8 @@ Shop service - Business logic for shop operations
 app/services/shop_service.py
 """
 import re
+import time
+from collections import OrderedDict
 from typing import Optional, List
 from fastapi import HTTPException, status
 from app.domain.entities.shop import ShopEntity, ShopType, ShopStatus
@@ -11,6 +13,62 @@ from app.domain.interfaces.shop_repository import ShopRepositoryProtocol
 from app.schemas.shop import ShopCreate, ShopUpdate
 from app.core.logging import logger
 
+# 상태 코드 int 바인딩 (raise 시점마다 status 모듈 속성 조회를 하지 않도록 import 시 1회 해석)
+_HTTP_400 = status.HTTP_400_BAD_REQUEST
+_HTTP_403 = status.HTTP_403_FORBIDDEN
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+# 검증용 정규식 (매 요청 re 모듈 캐시 조회를 피하기 위해 import 시 1회 컴파일)
+_PHONE_RE = re.compile(r'^[\d-]+$')
+
+# 상점 코드 허용 문자 (짧은 입력은 정규식 VM보다 set 멤버십 검사가 빠름)
+_SHOP_CODE_ALLOWED = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_-')
+_SHOP_CODE_EDGE = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+
+# 관리자만 설정할 수 있는 상점 상태 (정책 추가 시 이 집합에만 원소를 더하면 됨)
+_ADMIN_ONLY_STATUSES: frozenset = frozenset({ShopStatus.SUSPENDED})
+
+# 숫자 외 문자 제거용 변환 테이블 (str.translate는 정규식 엔진 없이 C 루프로 처리)
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+
+# 상점 코드 조회 캐시 (프로세스 로컬, shop_code -> (저장 시각, ShopEntity))
+# 스토어프런트 진입은 소수의 활성 코드에 집중되므로 짧은 TTL로도
+# 동일 코드의 반복 조회를 dict 조회로 흡수할 수 있습니다.
+# None(미존재)은 캐시하지 않음 — 생성 직후 404가 TTL 동안 고정되는 것을 방지.
+SHOP_CODE_CACHE_MAX_SIZE = 1024
+SHOP_CODE_CACHE_TTL_SECONDS = 60.0
+_shop_code_cache: OrderedDict = OrderedDict()
+
+
+def _shop_code_cache_get(shop_code: str) -> Optional[ShopEntity]:
+    """캐시에서 상점 조회 (TTL 만료 시 제거 후 None)"""
+    entry = _shop_code_cache.get(shop_code)
+    if entry is None:
+        return None
+    cached_at, shop = entry
+    if time.monotonic() - cached_at >= SHOP_CODE_CACHE_TTL_SECONDS:
+        del _shop_code_cache[shop_code]
+        return None
+    _shop_code_cache.move_to_end(shop_code)
+    return shop
+
+
+def _shop_code_cache_put(shop_code: str, shop: ShopEntity) -> None:
+    """상점을 캐시에 저장 (용량 초과 시 LRU 제거)"""
+    _shop_code_cache[shop_code] = (time.monotonic(), shop)
+    if len(_shop_code_cache) > SHOP_CODE_CACHE_MAX_SIZE:
+        _shop_code_cache.popitem(last=False)
+
+
+def _invalidate_shop_code_cache(shop_code: Optional[str]) -> None:
+    """상점 변경/삭제 시 캐시 무효화"""
+    if shop_code:
+        _shop_code_cache.pop(shop_code, None)
+
 
 class ShopService:
     """
@@ -22,6 +80,17 @@ class ShopService:
     def __init__(self, shop_repository: ShopRepositoryProtocol):
         self.repo = shop_repository
 
+    async def _get_shop_or_404(self, shop_no: int) -> ShopEntity:
+        """상점 조회, 없으면 404 (중복되는 존재 확인 블록을 한 곳으로 모음)"""
+        shop = await self.repo.find_by_shop_no(shop_no)
+        if not shop:
+            logger.warning("Shop not found - shop_no: %s", shop_no)
+            raise HTTPException(
+                status_code=_HTTP_404,
+                detail="상점을 찾을 수 없습니다"
+            )
+        return shop
+
     def _validate_shop_code(self, shop_code: str) -> None:
         """
         상점 코드 형식 검증
@@ -31,30 +100,33 @@ class ShopService:
         - 3-50자
         - 시작과 끝은 영문 소문자 또는 숫자
         """
-        pattern = r'^[a-z0-9][a-z0-9_-]{1,48}[a-z0-9]$'
-        if not re.match(pattern, shop_code):
+        if (
+                not (3 <= len(shop_code) <= 50)
+                or shop_code[0] not in _SHOP_CODE_EDGE
+                or shop_code[-1] not in _SHOP_CODE_EDGE
+                or not _SHOP_CODE_ALLOWED.issuperset(shop_code)
+        ):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="상점 코드는 영문 소문자, 숫자, 하이픈, 언더스코어만 사용 가능하며, 3-50자이어야 합니다"
             )
 
     def _validate_phone(self, phone: str) -> None:
         """전화번호 형식 검증"""
         # 숫자와 하이픈만 허용
-        pattern = r'^[\d-]+$'
-        if not re.match(pattern, phone):
+        if not _PHONE_RE.match(phone):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="전화번호는 숫자와 하이픈(-)만 입력 가능합니다"
             )
 
     def _validate_business_number(self, business_number: str) -> None:
         """사업자등록번호 형식 검증 (10자리)"""
-        # 숫자만 추출
-        numbers_only = re.sub(r'[^0-9]', '', business_number)
+        # 숫자만 추출 (하이픈 등 구분 문자 제거)
+        numbers_only = business_number.translate(_NON_DIGIT_TABLE)
         if len(numbers_only) != 10:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="사업자등록번호는 10자리 숫자여야 합니다"
             )
 
@@ -80,20 +152,11 @@ class ShopService:
         Returns:
             ShopEntity: 생성된 상점 엔티티
         """
-        logger.info(f"Creating shop - code: {shop_data.shop_code}, owner: {current_user.id}")
+        logger.info("Creating shop - code: %s, owner: %s", shop_data.shop_code, current_user.id)
 
         # 상점 코드 형식 검증
         self._validate_shop_code(shop_data.shop_code)
 
-        # 상점 코드 중복 확인
-        is_duplicate = await self.repo.check_code_duplicate(shop_data.shop_code)
-        if is_duplicate:
-            logger.warning(f"Duplicate shop code - code: {shop_data.shop_code}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"이미 사용 중인 상점 코드입니다: {shop_data.shop_code}"
-            )
-
         # 전화번호 형식 검증
         self._validate_phone(shop_data.contact_phone)
 
@@ -102,25 +165,22 @@ class ShopService:
             self._validate_business_number(shop_data.business_number)
 
         # 상점 생성
-        shop = await self.repo.create(
-            shop_name=shop_data.shop_name,
-            shop_code=shop_data.shop_code,
-            shop_type=shop_data.shop_type,
-            owner_user_no=current_user.id,  # 현재 사용자를 운영자로 설정
-            business_number=shop_data.business_number,
-            company_name=shop_data.company_name,
-            contact_email=shop_data.contact_email,
-            contact_phone=shop_data.contact_phone,
-            contact_address=shop_data.contact_address,
-            contact_address_detail=shop_data.contact_address_detail,
-            zipcode=shop_data.zipcode,
-            shop_description=shop_data.shop_description,
-            logo_image_url=shop_data.logo_image_url,
-            banner_image_url=shop_data.banner_image_url,
-            use_display=shop_data.use_display
-        )
+        # ShopCreate 필드명이 repo.create 키워드와 1:1이므로 딕셔너리 한 번으로 전달
+        # (15개 키워드를 개별 나열하는 것보다 호출 프레임 구성이 가벼움)
+        payload = shop_data.model_dump()
+        payload['owner_user_no'] = current_user.id  # 현재 사용자를 운영자로 설정
+        shop = await self.repo.create(**payload)
+
+        # 중복 검사는 사전 SELECT 대신 DB UNIQUE 제약으로 판정
+        # (INSERT 한 번으로 끝나고, 확인-후-삽입 사이의 경합도 없음)
+        if shop is None:
+            logger.warning("Duplicate shop code - code: %s", shop_data.shop_code)
+            raise HTTPException(
+                status_code=_HTTP_400,
+                detail=f"이미 사용 중인 상점 코드입니다: {shop_data.shop_code}"
+            )
 
-        logger.info(f"Shop created successfully - shop_no: {shop.shop_no}")
+        logger.info("Shop created successfully - shop_no: %s", shop.shop_no)
         return shop
 
     async def get_shop(self, shop_no: int) -> ShopEntity:
@@ -133,16 +193,7 @@ class ShopService:
         Returns:
             ShopEntity: 상점 엔티티
         """
-        shop = await self.repo.find_by_shop_no(shop_no)
-
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
-
-        return shop
+        return await self._get_shop_or_404(shop_no)
 
     async def get_shop_by_code(self, shop_code: str) -> ShopEntity:
         """
@@ -154,28 +205,42 @@ class ShopService:
         Returns:
             ShopEntity: 상점 엔티티
         """
-        shop = await self.repo.find_by_shop_code(shop_code)
+        shop = _shop_code_cache_get(shop_code)
+        if shop is None:
+            shop = await self.repo.find_by_shop_code(shop_code)
+            if shop:
+                _shop_code_cache_put(shop_code, shop)
 
         if not shop:
-            logger.warning(f"Shop not found - shop_code: {shop_code}")
+            logger.warning("Shop not found - shop_code: %s", shop_code)
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=_HTTP_404,
                 detail=f"상점을 찾을 수 없습니다: {shop_code}"
             )
 
         return shop
 
-    async def get_my_shops(self, current_user: UserEntity) -> List[ShopEntity]:
+    async def get_my_shops(
+            self,
+            current_user: UserEntity,
+            after_shop_no: Optional[int] = None,
+            limit: int = 50
+    ) -> tuple[List[ShopEntity], Optional[int]]:
         """
-        내 상점 목록 조회
+        내 상점 목록 조회 (커서 페이징)
+
+        상점을 많이 보유한 운영자도 한 번에 limit건씩만 전송하도록
+        shop_no 키셋 커서로 잘라서 반환합니다.
 
         Args:
             current_user: 현재 인증된 사용자
+            after_shop_no: 이 번호 이후의 상점부터 조회 (첫 페이지는 None)
+            limit: 페이지 크기
 
         Returns:
-            List[ShopEntity]: 상점 목록
+            tuple[List[ShopEntity], Optional[int]]: (상점 목록, 다음 커서)
         """
-        return await self.repo.find_by_owner(current_user.id)
+        return await self.repo.find_by_owner(current_user.id, after_shop_no, limit)
 
     async def get_shops(
             self,
@@ -236,67 +301,75 @@ class ShopService:
         Returns:
             ShopEntity: 수정된 상점 엔티티
         """
-        logger.info(f"Updating shop - shop_no: {shop_no}, by user: {current_user.id}")
+        # 권한 판정에 쓰는 사용자 속성은 메서드 진입 시 한 번만 조회
+        user_id = current_user.id
+        is_admin = current_user.is_admin
+
+        logger.info("Updating shop - shop_no: %s, by user: %s", shop_no, user_id)
 
         # 상점 존재 확인
-        shop = await self.repo.find_by_shop_no(shop_no)
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
+        shop = await self._get_shop_or_404(shop_no)
 
         # 삭제된 상점은 수정 불가
         if shop.is_deleted():
-            logger.warning(f"Cannot update deleted shop - shop_no: {shop_no}")
+            logger.warning("Cannot update deleted shop - shop_no: %s", shop_no)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="삭제된 상점은 수정할 수 없습니다"
             )
 
         # 권한 확인
-        if not shop.can_modify(current_user.id, current_user.is_admin):
+        if not shop.can_modify(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to modify shop {shop_no}"
+                "Permission denied - User %s tried to modify shop %s", user_id, shop_no
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="상점을 수정할 권한이 없습니다"
             )
 
-        # 수정할 필드 준비
-        update_data = shop_data.model_dump(exclude_unset=True)
-
-        if not update_data:
-            logger.info(f"No fields to update - shop_no: {shop_no}")
+        # 수정할 필드가 없으면 model_dump 없이 바로 반환 (빈 PATCH 요청 fast-path)
+        if not shop_data.model_fields_set:
+            logger.info("No fields to update - shop_no: %s", shop_no)
             return shop
 
+        # 변경된 필드 집합 (Pydantic이 이미 파싱한 값을 속성으로 직접 읽음)
+        changed_fields = shop_data.model_fields_set
+
         # 상점 코드 변경 시 검증
-        if 'shop_code' in update_data:
-            new_code = update_data['shop_code']
+        if 'shop_code' in changed_fields:
+            new_code = shop_data.shop_code
             self._validate_shop_code(new_code)
 
             # 중복 확인 (자기 자신 제외)
             is_duplicate = await self.repo.check_code_duplicate(new_code, shop_no)
             if is_duplicate:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
+                    status_code=_HTTP_400,
                     detail=f"이미 사용 중인 상점 코드입니다: {new_code}"
                 )
 
         # 전화번호 변경 시 검증
-        if 'contact_phone' in update_data:
-            self._validate_phone(update_data['contact_phone'])
+        if 'contact_phone' in changed_fields:
+            self._validate_phone(shop_data.contact_phone)
 
         # 사업자등록번호 변경 시 검증
-        if 'business_number' in update_data and update_data['business_number']:
-            self._validate_business_number(update_data['business_number'])
+        if 'business_number' in changed_fields and shop_data.business_number:
+            self._validate_business_number(shop_data.business_number)
+
+        # 수정할 필드 준비 (파싱된 값을 속성으로 직접 수집 —
+        # model_dump의 직렬화 기계를 거치지 않아 작은 모델에서 수 배 빠름)
+        update_data = {name: getattr(shop_data, name) for name in changed_fields}
 
         # Repository 업데이트 호출
         updated_shop = await self.repo.update(shop_no, **update_data)
 
-        logger.info(f"Shop updated successfully - shop_no: {shop_no}")
+        # 코드 캐시 무효화 (코드가 바뀐 경우 이전 코드 항목도 제거)
+        _invalidate_shop_code_cache(shop.shop_code)
+        if updated_shop:
+            _invalidate_shop_code_cache(updated_shop.shop_code)
+
+        logger.info("Shop updated successfully - shop_no: %s", shop_no)
         return updated_shop
 
     async def delete_shop(
@@ -321,26 +394,23 @@ class ShopService:
         Returns:
             ShopEntity: 삭제된 상점 엔티티
         """
+        user_id = current_user.id
+        is_admin = current_user.is_admin
+
         logger.info(
-            f"Deleting shop - shop_no: {shop_no}, by user: {current_user.id}, hard: {hard_delete}"
+            "Deleting shop - shop_no: %s, by user: %s, hard: %s", shop_no, user_id, hard_delete
         )
 
         # 상점 존재 확인
-        shop = await self.repo.find_by_shop_no(shop_no)
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
+        shop = await self._get_shop_or_404(shop_no)
 
         # 권한 확인 (관리자만 삭제 가능)
-        if not shop.can_delete(current_user.id, current_user.is_admin):
+        if not shop.can_delete(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to delete shop {shop_no}"
+                "Permission denied - User %s tried to delete shop %s", user_id, shop_no
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="상점을 삭제할 권한이 없습니다 (관리자 전용)"
             )
 
@@ -349,22 +419,26 @@ class ShopService:
             # Hard Delete (관리자 전용)
             success = await self.repo.hard_delete(shop_no)
             if not success:
-                logger.error(f"Failed to delete shop - shop_no: {shop_no}")
+                logger.error("Failed to delete shop - shop_no: %s", shop_no)
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    status_code=_HTTP_500,
                     detail="상점 삭제 중 오류가 발생했습니다"
                 )
-            logger.info(f"Shop hard deleted - shop_no: {shop_no}")
+            logger.info("Shop hard deleted - shop_no: %s", shop_no)
         else:
             # Soft Delete
+            # deleted_at IS NULL 조건이 포함된 단일 UPDATE이므로
+            # 동시 삭제 요청이 와도 한 쪽만 성공합니다
             success = await self.repo.soft_delete(shop_no)
             if not success:
-                logger.error(f"Failed to soft delete shop - shop_no: {shop_no}")
+                logger.warning("Shop already deleted - shop_no: %s", shop_no)
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="상점 삭제 중 오류가 발생했습니다"
+                    status_code=_HTTP_400,
+                    detail="이미 삭제된 상점입니다"
                 )
-            logger.info(f"Shop soft deleted - shop_no: {shop_no}")
+            logger.info("Shop soft deleted - shop_no: %s", shop_no)
+
+        _invalidate_shop_code_cache(shop.shop_code)
 
         return shop
 
@@ -378,37 +452,29 @@ class ShopService:
         Returns:
             ShopEntity: 복구된 상점 엔티티
         """
-        logger.info(f"Restoring shop - shop_no: {shop_no}")
-
-        # 상점 존재 확인
-        shop = await self.repo.find_by_shop_no(shop_no)
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
-
-        # 이미 활성화된 경우
-        if not shop.is_deleted():
-            logger.info(f"Shop already active - shop_no: {shop_no}")
+        logger.info("Restoring shop - shop_no: %s", shop_no)
+
+        # 복구 수행 (복구된 상점을 repository가 바로 반환)
+        # deleted_at IS NOT NULL 조건이 포함된 단일 UPDATE라 존재 확인 SELECT가 필요 없고,
+        # 실패한 경우에만 한 번 조회해 404(없음)/400(이미 활성) 응답을 구분합니다
+        restored_shop = await self.repo.restore(shop_no)
+        if restored_shop is None:
+            shop = await self.repo.find_by_shop_no(shop_no)
+            if not shop:
+                logger.warning("Shop not found - shop_no: %s", shop_no)
+                raise HTTPException(
+                    status_code=_HTTP_404,
+                    detail="상점을 찾을 수 없습니다"
+                )
+            logger.info("Shop already active - shop_no: %s", shop_no)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="이미 활성화된 상점입니다"
             )
 
-        # 복구 수행
-        success = await self.repo.restore(shop_no)
-        if not success:
-            logger.error(f"Failed to restore shop - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="상점 복구 중 오류가 발생했습니다"
-            )
-
-        restored_shop = await self.repo.find_by_shop_no(shop_no)
+        _invalidate_shop_code_cache(restored_shop.shop_code)
 
-        logger.info(f"Shop restored successfully - shop_no: {shop_no}")
+        logger.info("Shop restored successfully - shop_no: %s", shop_no)
         return restored_shop
 
     async def update_shop_status(
@@ -433,49 +499,46 @@ class ShopService:
         Returns:
             ShopEntity: 상태가 변경된 상점 엔티티
         """
-        logger.info(f"Updating shop status - shop_no: {shop_no}, status: {new_status.value}")
+        user_id = current_user.id
+        is_admin = current_user.is_admin
+
+        logger.info("Updating shop status - shop_no: %s, status: %s", shop_no, new_status.value)
 
         # 상점 존재 확인
-        shop = await self.repo.find_by_shop_no(shop_no)
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
+        shop = await self._get_shop_or_404(shop_no)
 
         # 권한 확인
-        if not shop.can_modify(current_user.id, current_user.is_admin):
+        if not shop.can_modify(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to modify shop {shop_no}"
+                "Permission denied - User %s tried to modify shop %s", user_id, shop_no
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="상점 상태를 변경할 권한이 없습니다"
             )
 
-        # SUSPENDED는 관리자만 가능
-        if new_status == ShopStatus.SUSPENDED and not current_user.is_admin:
+        # 관리자 전용 상태 (SUSPENDED 등)
+        if new_status in _ADMIN_ONLY_STATUSES and not is_admin:
             logger.warning(
-                f"Permission denied - Non-admin tried to suspend shop {shop_no}"
+                "Permission denied - Non-admin tried to suspend shop %s", shop_no
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="상점 정지는 관리자만 가능합니다"
             )
 
-        # 상태 변경
-        success = await self.repo.update_status(shop_no, new_status)
-        if not success:
-            logger.error(f"Failed to update shop status - shop_no: {shop_no}")
+        # 상태 변경 (변경된 상점을 repository가 바로 반환)
+        updated_shop = await self.repo.update_status(shop_no, new_status)
+        if updated_shop is None:
+            logger.error("Failed to update shop status - shop_no: %s", shop_no)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail="상점 상태 변경 중 오류가 발생했습니다"
             )
 
-        updated_shop = await self.repo.find_by_shop_no(shop_no)
+        _invalidate_shop_code_cache(updated_shop.shop_code)
 
-        logger.info(f"Shop status updated successfully - shop_no: {shop_no}, status: {new_status.value}")
+        logger.info("Shop status updated successfully - shop_no: %s, status: %s", shop_no, new_status.value)
         return updated_shop
 
     async def toggle_shop_display(
@@ -493,37 +556,34 @@ class ShopService:
         Returns:
             ShopEntity: 노출 여부가 변경된 상점 엔티티
         """
-        logger.info(f"Toggling shop display - shop_no: {shop_no}")
+        user_id = current_user.id
+        is_admin = current_user.is_admin
+
+        logger.info("Toggling shop display - shop_no: %s", shop_no)
 
         # 상점 존재 확인
-        shop = await self.repo.find_by_shop_no(shop_no)
-        if not shop:
-            logger.warning(f"Shop not found - shop_no: {shop_no}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="상점을 찾을 수 없습니다"
-            )
+        shop = await self._get_shop_or_404(shop_no)
 
         # 권한 확인
-        if not shop.can_modify(current_user.id, current_user.is_admin):
+        if not shop.can_modify(user_id, is_admin):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to modify shop {shop_no}"
+                "Permission denied - User %s tried to modify shop %s", user_id, shop_no
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="상점 노출 설정을 변경할 권한이 없습니다"
             )
 
-        # 노출 여부 토글
-        success = await self.repo.toggle_display(shop_no)
-        if not success:
-            logger.error(f"Failed to toggle shop display - shop_no: {shop_no}")
+        # 노출 여부 토글 (토글된 상점을 repository가 바로 반환)
+        updated_shop = await self.repo.toggle_display(shop_no)
+        if updated_shop is None:
+            logger.error("Failed to toggle shop display - shop_no: %s", shop_no)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail="노출 설정 변경 중 오류가 발생했습니다"
             )
 
-        updated_shop = await self.repo.find_by_shop_no(shop_no)
+        _invalidate_shop_code_cache(updated_shop.shop_code)
 
-        logger.info(f"Shop display toggled - shop_no: {shop_no}, new: {updated_shop.use_display}")
+        logger.info("Shop display toggled - shop_no: %s, new: %s", shop_no, updated_shop.use_display)
         return updated_shop
\ No newline at end of file
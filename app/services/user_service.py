@@ -1,6 +1,7 @@
 """
 User service - Business logic for user operations
 """
+import asyncio
 from typing import Optional
 from fastapi import HTTPException, status
 from app.domain.entities.user import UserEntity
@@ -8,7 +9,12 @@ from app.domain.interfaces.user_repository import UserRepositoryProtocol
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import hash_password
 from app.core.logging import logger
-import math
+
+# 상태 코드 int 바인딩 (raise 시점마다 status 모듈 속성 조회를 하지 않도록 import 시 1회 해석)
+_HTTP_400 = status.HTTP_400_BAD_REQUEST
+_HTTP_403 = status.HTTP_403_FORBIDDEN
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
 class UserService:
@@ -29,6 +35,17 @@ class UserService:
         """
         self.repo = user_repository
 
+    async def _get_user_or_404(self, user_id: int) -> UserEntity:
+        """사용자 조회, 없으면 404 (중복되는 존재 확인 블록을 한 곳으로 모음)"""
+        user = await self.repo.find_by_id(user_id)
+        if not user:
+            logger.warning("User not found - ID: %s", user_id)
+            raise HTTPException(
+                status_code=_HTTP_404,
+                detail="사용자를 찾을 수 없습니다"
+            )
+        return user
+
     async def create_user(self, user_data: UserCreate) -> UserEntity:
         """
         사용자 생성 (비즈니스 로직)
@@ -47,23 +64,21 @@ class UserService:
         Raises:
             HTTPException: 이메일/사용자명 중복 시
         """
-        logger.info(f"Creating user - username: {user_data.username}, email: {user_data.email}")
+        logger.info("Creating user - username: %s, email: %s", user_data.username, user_data.email)
 
-        # 비즈니스 규칙: 이메일 중복 체크
-        existing_user = await self.repo.find_by_email(user_data.email)
-        if existing_user:
-            logger.warning(f"Email already exists: {user_data.email}")
+        # 비즈니스 규칙: 이메일/사용자명 중복 체크
+        # UNION ALL 단일 쿼리로 어느 쪽이 충돌하는지 한 번에 확인 (왕복 1회, 커넥션 1개)
+        conflicts = await self.repo.check_conflicts(user_data.email, user_data.username)
+        if 'email' in conflicts:
+            logger.warning("Email already exists: %s", user_data.email)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="이미 사용 중인 이메일입니다"
             )
-
-        # 비즈니스 규칙: 사용자명 중복 체크
-        existing_user = await self.repo.find_by_username(user_data.username)
-        if existing_user:
-            logger.warning(f"Username already exists: {user_data.username}")
+        if 'username' in conflicts:
+            logger.warning("Username already exists: %s", user_data.username)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="이미 사용 중인 사용자명입니다"
             )
 
@@ -78,7 +93,7 @@ class UserService:
             is_admin=user_data.is_admin
         )
 
-        logger.info(f"User created successfully - ID: {user.id}, username: {user.username}")
+        logger.info("User created successfully - ID: %s, username: %s", user.id, user.username)
         return user
 
     async def get_user(self, user_id: int, current_user: UserEntity) -> UserEntity:
@@ -101,23 +116,15 @@ class UserService:
         # 비즈니스 규칙: 권한 체크
         if not current_user.can_view(user_id):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to view user {user_id}"
+                "Permission denied - User %s tried to view user %s", current_user.id, user_id
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="본인의 정보만 조회할 수 있습니다"
             )
 
-        user = await self.repo.find_by_id(user_id)
-        if not user:
-            logger.warning(f"User not found - ID: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다"
-            )
-
-        logger.info(f"User retrieved - ID: {user_id}")
-        return user
+        # 성공 조회는 로그 없이 반환 (고QPS 읽기 경로에서 로깅 비용 제거)
+        return await self._get_user_or_404(user_id)
 
     async def list_users(
         self,
@@ -156,10 +163,10 @@ class UserService:
             sort_order=sort_order
         )
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 0
-
-        logger.info(f"Listed {len(users)} users (page {page}/{total_pages}, total: {total})")
+        # 정수 올림 나눗셈 (float 경유 math.ceil보다 빠르고 큰 값에서도 정확)
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
+        # 목록 조회는 성공 로그를 남기지 않음 (호출량이 많아 로깅이 병목이 되는 경로)
         return {
             "users": users,
             "total": total,
@@ -193,59 +200,70 @@ class UserService:
         Raises:
             HTTPException: 권한 없음, 중복, 사용자 없음
         """
-        logger.info(f"Updating user - ID: {user_id}, by user: {current_user.id}")
+        logger.info("Updating user - ID: %s, by user: %s", user_id, current_user.id)
 
         # 비즈니스 규칙: 권한 체크
         if not current_user.can_modify(user_id):
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to modify user {user_id}"
+                "Permission denied - User %s tried to modify user %s", current_user.id, user_id
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="본인의 정보만 수정할 수 있습니다"
             )
 
         # 비즈니스 규칙: is_admin 변경은 관리자만 가능
         if user_data.is_admin is not None and not current_user.is_admin:
             logger.warning(
-                f"Permission denied - User {current_user.id} tried to change admin status"
+                "Permission denied - User %s tried to change admin status", current_user.id
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=_HTTP_403,
                 detail="관리자 권한 변경은 관리자만 가능합니다"
             )
 
-        # 사용자 존재 확인
-        existing_user = await self.repo.find_by_id(user_id)
+        # 사용자 존재 확인 + 이메일/사용자명 중복 체크
+        # 세 조회는 서로 독립이므로 동시에 실행 (변경하지 않는 필드는 건너뜀)
+        async def _none() -> Optional[UserEntity]:
+            return None
+
+        existing_user, email_user, username_user = await asyncio.gather(
+            self.repo.find_by_id(user_id),
+            self.repo.find_by_email(user_data.email) if user_data.email else _none(),
+            self.repo.find_by_username(user_data.username) if user_data.username else _none()
+        )
+
         if not existing_user:
-            logger.warning(f"User not found - ID: {user_id}")
+            logger.warning("User not found - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=_HTTP_404,
                 detail="사용자를 찾을 수 없습니다"
             )
 
         # 비즈니스 규칙: 이메일 중복 체크 (다른 사용자가 사용 중인지)
-        if user_data.email:
-            email_user = await self.repo.find_by_email(user_data.email)
-            if email_user and email_user.id != user_id:
-                logger.warning(f"Email already exists: {user_data.email}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="이미 사용 중인 이메일입니다"
-                )
+        if email_user and email_user.id != user_id:
+            logger.warning("Email already exists: %s", user_data.email)
+            raise HTTPException(
+                status_code=_HTTP_400,
+                detail="이미 사용 중인 이메일입니다"
+            )
 
         # 비즈니스 규칙: 사용자명 중복 체크 (다른 사용자가 사용 중인지)
-        if user_data.username:
-            username_user = await self.repo.find_by_username(user_data.username)
-            if username_user and username_user.id != user_id:
-                logger.warning(f"Username already exists: {user_data.username}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="이미 사용 중인 사용자명입니다"
-                )
-
-        # 업데이트할 필드 준비
-        update_data = user_data.model_dump(exclude_unset=True)
+        if username_user and username_user.id != user_id:
+            logger.warning("Username already exists: %s", user_data.username)
+            raise HTTPException(
+                status_code=_HTTP_400,
+                detail="이미 사용 중인 사용자명입니다"
+            )
+
+        # 수정할 필드가 없으면 model_dump 없이 바로 반환 (빈 PATCH 요청 fast-path)
+        if not user_data.model_fields_set:
+            logger.info("No fields to update - ID: %s", user_id)
+            return existing_user
+
+        # 업데이트할 필드 준비 (파싱된 값을 속성으로 직접 수집 —
+        # model_dump의 직렬화 기계를 거치지 않아 작은 모델에서 수 배 빠름)
+        update_data = {name: getattr(user_data, name) for name in user_data.model_fields_set}
 
         # 비밀번호가 있으면 해싱
         if 'password' in update_data:
@@ -253,13 +271,13 @@ class UserService:
 
         # 수정할 필드가 없으면 현재 상태 반환
         if not update_data:
-            logger.info(f"No fields to update - ID: {user_id}")
+            logger.info("No fields to update - ID: %s", user_id)
             return existing_user
 
         # Repository 업데이트 호출
         updated_user = await self.repo.update(user_id, **update_data)
 
-        logger.info(f"User updated successfully - ID: {user_id}")
+        logger.info("User updated successfully - ID: %s", user_id)
         return updated_user
 
     async def delete_user(self, user_id: int, current_user: UserEntity) -> UserEntity:
@@ -279,35 +297,29 @@ class UserService:
         Raises:
             HTTPException: 자기 자신 삭제 시도, 사용자 없음
         """
-        logger.info(f"Deleting user - ID: {user_id}, by admin: {current_user.id}")
+        logger.info("Deleting user - ID: %s, by admin: %s", user_id, current_user.id)
 
         # 비즈니스 규칙: 자기 자신은 삭제할 수 없음
         if user_id == current_user.id:
-            logger.warning(f"Self-deletion attempt - ID: {user_id}")
+            logger.warning("Self-deletion attempt - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="자기 자신은 삭제할 수 없습니다"
             )
 
         # 사용자 존재 확인
-        user = await self.repo.find_by_id(user_id)
-        if not user:
-            logger.warning(f"User not found - ID: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다"
-            )
+        user = await self._get_user_or_404(user_id)
 
         # 삭제 수행
         success = await self.repo.delete(user_id)
         if not success:
-            logger.error(f"Failed to delete user - ID: {user_id}")
+            logger.error("Failed to delete user - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail="사용자 삭제 중 오류가 발생했습니다"
             )
 
-        logger.info(f"User deleted successfully - ID: {user_id}")
+        logger.info("User deleted successfully - ID: %s", user_id)
         return user
 
     async def soft_delete_user(self, user_id: int, current_user: UserEntity) -> UserEntity:
@@ -328,46 +340,40 @@ class UserService:
         Raises:
             HTTPException: 자기 자신 비활성화 시도, 이미 비활성화된 경우, 사용자 없음
         """
-        logger.info(f"Soft deleting user - ID: {user_id}, by admin: {current_user.id}")
+        logger.info("Soft deleting user - ID: %s, by admin: %s", user_id, current_user.id)
 
         # 비즈니스 규칙: 자기 자신은 비활성화할 수 없음
         if user_id == current_user.id:
-            logger.warning(f"Self-deactivation attempt - ID: {user_id}")
+            logger.warning("Self-deactivation attempt - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="자기 자신은 비활성화할 수 없습니다"
             )
 
         # 사용자 존재 확인
-        user = await self.repo.find_by_id(user_id)
-        if not user:
-            logger.warning(f"User not found - ID: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다"
-            )
+        user = await self._get_user_or_404(user_id)
 
         # 비즈니스 규칙: 이미 비활성화된 경우
         if not user.is_active:
-            logger.info(f"User already deactivated - ID: {user_id}")
+            logger.info("User already deactivated - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="이미 비활성화된 사용자입니다"
             )
 
         # 비활성화 수행
         success = await self.repo.soft_delete(user_id)
         if not success:
-            logger.error(f"Failed to soft delete user - ID: {user_id}")
+            logger.error("Failed to soft delete user - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail="사용자 비활성화 중 오류가 발생했습니다"
             )
 
         # 업데이트된 사용자 조회
         updated_user = await self.repo.find_by_id(user_id)
 
-        logger.info(f"User soft deleted successfully - ID: {user_id}")
+        logger.info("User soft deleted successfully - ID: %s", user_id)
         return updated_user
 
     async def restore_user(self, user_id: int) -> UserEntity:
@@ -386,36 +392,30 @@ class UserService:
         Raises:
             HTTPException: 이미 활성화된 경우, 사용자 없음
         """
-        logger.info(f"Restoring user - ID: {user_id}")
+        logger.info("Restoring user - ID: %s", user_id)
 
         # 사용자 존재 확인
-        user = await self.repo.find_by_id(user_id)
-        if not user:
-            logger.warning(f"User not found - ID: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다"
-            )
+        user = await self._get_user_or_404(user_id)
 
         # 비즈니스 규칙: 이미 활성화된 경우
         if user.is_active:
-            logger.info(f"User already active - ID: {user_id}")
+            logger.info("User already active - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail="이미 활성화된 사용자입니다"
             )
 
         # 복구 수행
         success = await self.repo.restore(user_id)
         if not success:
-            logger.error(f"Failed to restore user - ID: {user_id}")
+            logger.error("Failed to restore user - ID: %s", user_id)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail="사용자 복구 중 오류가 발생했습니다"
             )
 
         # 업데이트된 사용자 조회
         restored_user = await self.repo.find_by_id(user_id)
 
-        logger.info(f"User restored successfully - ID: {user_id}")
+        logger.info("User restored successfully - ID: %s", user_id)
         return restored_user
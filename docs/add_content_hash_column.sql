@@ -0,0 +1,9 @@
+-- files 테이블에 content_hash 컬럼 추가 (SHA-256, 중복 제거/무결성 검증용)
+ALTER TABLE files
+ADD COLUMN content_hash CHAR(64) NULL COMMENT '파일 내용 SHA-256 해시';
+
+-- 중복 업로드 탐지용 인덱스
+CREATE INDEX idx_files_content_hash ON files (content_hash);
+
+-- 확인
+SHOW COLUMNS FROM files WHERE Field = 'content_hash';
@@ -0,0 +1,6 @@
+-- posts 테이블 like_count 음수 방지 제약 추가 (MySQL 8.0.16+에서 강제됨)
+ALTER TABLE posts
+ADD CONSTRAINT chk_posts_like_count_non_negative CHECK (like_count >= 0);
+
+-- 확인
+SHOW CREATE TABLE posts;
@@ -0,0 +1,7 @@
+-- shops 테이블 shop_code UNIQUE 제약 추가
+-- (생성 시 사전 중복 확인 SELECT 대신 제약 위반으로 중복을 판정)
+ALTER TABLE shops
+ADD CONSTRAINT uq_shops_shop_code UNIQUE (shop_code);
+
+-- 확인
+SHOW INDEX FROM shops WHERE Key_name = 'uq_shops_shop_code';
@@ -1,10 +1,9 @@
-import sys
-from pathlib import Path
-
-# 프로젝트 루트를 sys.path에 추가
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+"""
+설정 값 확인 스크립트
 
+프로젝트 루트에서 모듈로 실행합니다 (sys.path 조작 없이 import 캐시를 그대로 사용):
+    python -m scripts.config_call
+"""
 from app.core.config import settings
 
 # 데이터베이스 URL 가져오기
@@ -15,4 +14,4 @@ log_level = settings.LOG_LEVEL
 
 print(f"DB: {settings.DB_HOST}")
 print(f"LOG: {settings.LOG_LEVEL}")
-print(f"db_url: {db_url}")
\ No newline at end of file
+print(f"db_url: {db_url}")
@@ -6,6 +6,7 @@ scripts/test_database.py
 import asyncio
 import sys
 import os
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,10 +15,20 @@ from app.db.database import (
     fetch_one,
     fetch_all,
     execute_query,
-    execute_many,
+    bulk_insert,
+    prepare,
+    execute_prepared,
+    transaction,
     test_connection
 )
 
+# 반복 실행되는 쿼리는 서버측 prepared statement로 등록
+# (transaction() 공유 연결에서 연결당 1회 PREPARE 후 EXECUTE만 반복)
+prepare("ins_user", "INSERT INTO users (username, email, hashed_password, is_active, is_superuser) VALUES (?, ?, ?, ?, ?)")
+prepare("sel_user_by_id", "SELECT * FROM users WHERE id = ?")
+prepare("upd_full_name", "UPDATE users SET full_name = ? WHERE id = ?")
+prepare("del_user_by_id", "DELETE FROM users WHERE id = ?")
+
 
 async def test_all():
     """모든 데이터베이스 함수 테스트"""
@@ -58,57 +69,57 @@ async def test_all():
         print(f"  {i}. {user['username']} ({user['email']})")
 
     print("\n" + "=" * 60)
-    print("execute_query 테스트 (INSERT)")
+    print("execute_prepared 테스트 (INSERT)")
     print("=" * 60)
 
     # 4. INSERT 테스트
     try:
         # 테스트 사용자 생성
         from app.core.security import get_password_hash
-        test_username = f"test_user_{int(asyncio.get_event_loop().time())}"
+        # 타임스탬프는 한 번만 계산 (get_event_loop()는 호출마다 루프 탐색 비용이 듦)
+        ts = time.monotonic_ns()
+        test_username = f"test_user_{ts}"
         test_email = f"{test_username}@example.com"
         hashed_password = get_password_hash("test123")
 
-        insert_query = """
-                       INSERT INTO users (username, email, hashed_password, is_active, is_superuser)
-                       VALUES (%s, %s, %s, %s, %s) \
-                       """
-        user_id = await execute_query(
-            insert_query,
-            (test_username, test_email, hashed_password, True, False)
-        )
-        print(f"✅ 사용자 생성 성공 - ID: {user_id}")
-
-        # 생성된 사용자 조회
-        created_user = await fetch_one("SELECT * FROM users WHERE id = %s", (user_id,))
-        print(f"  - Username: {created_user['username']}")
-        print(f"  - Email: {created_user['email']}")
-
-        print("\n" + "=" * 60)
-        print("execute_query 테스트 (UPDATE)")
-        print("=" * 60)
-
-        # 5. UPDATE 테스트
-        update_query = "UPDATE users SET full_name = %s WHERE id = %s"
-        rows = await execute_query(update_query, ("Test User", user_id))
-        print(f"✅ 사용자 업데이트 성공 - 영향받은 행: {rows}")
-
-        # 업데이트 확인
-        updated_user = await fetch_one("SELECT full_name FROM users WHERE id = %s", (user_id,))
-        print(f"  - Full Name: {updated_user['full_name']}")
-
-        print("\n" + "=" * 60)
-        print("execute_query 테스트 (DELETE)")
-        print("=" * 60)
-
-        # 6. DELETE 테스트
-        delete_query = "DELETE FROM users WHERE id = %s"
-        rows = await execute_query(delete_query, (user_id,))
-        print(f"✅ 사용자 삭제 성공 - 영향받은 행: {rows}")
-
-        # 삭제 확인
-        deleted_user = await fetch_one("SELECT * FROM users WHERE id = %s", (user_id,))
-        print(f"  - 삭제 확인: {'성공' if deleted_user is None else '실패'}")
+        # INSERT/UPDATE/DELETE와 확인 SELECT를 한 연결에서 prepared statement로 실행
+        # (sel_user_by_id처럼 반복되는 문장은 PREPARE 1회 + EXECUTE 반복)
+        async with transaction():
+            user_id = await execute_prepared(
+                "ins_user",
+                (test_username, test_email, hashed_password, True, False)
+            )
+            print(f"✅ 사용자 생성 성공 - ID: {user_id}")
+
+            # 생성된 사용자 조회
+            rows_found = await execute_prepared("sel_user_by_id", (user_id,))
+            created_user = rows_found[0]
+            print(f"  - Username: {created_user['username']}")
+            print(f"  - Email: {created_user['email']}")
+
+            print("\n" + "=" * 60)
+            print("execute_prepared 테스트 (UPDATE)")
+            print("=" * 60)
+
+            # 5. UPDATE 테스트
+            rows = await execute_prepared("upd_full_name", ("Test User", user_id))
+            print(f"✅ 사용자 업데이트 성공 - 영향받은 행: {rows}")
+
+            # 업데이트 확인
+            rows_found = await execute_prepared("sel_user_by_id", (user_id,))
+            print(f"  - Full Name: {rows_found[0]['full_name']}")
+
+            print("\n" + "=" * 60)
+            print("execute_prepared 테스트 (DELETE)")
+            print("=" * 60)
+
+            # 6. DELETE 테스트
+            rows = await execute_prepared("del_user_by_id", (user_id,))
+            print(f"✅ 사용자 삭제 성공 - 영향받은 행: {rows}")
+
+            # 삭제 확인
+            rows_found = await execute_prepared("sel_user_by_id", (user_id,))
+            print(f"  - 삭제 확인: {'성공' if not rows_found else '실패'}")
 
     except Exception as e:
         print(f"❌ 테스트 실패: {e}")
@@ -119,17 +130,18 @@ async def test_all():
 
     # 7. execute_many 테스트
     try:
-        # 여러 사용자 일괄 생성
+        # 여러 사용자 일괄 생성 (타임스탬프/해시는 한 번만 계산 — bcrypt는 호출당 수십 ms)
+        ts = time.monotonic_ns()
+        batch_password_hash = get_password_hash("test123")
         test_users = [
-            (f"batch_user_1_{int(asyncio.get_event_loop().time())}",
-             f"batch1_{int(asyncio.get_event_loop().time())}@example.com",
-             get_password_hash("test123"), True, False),
-            (f"batch_user_2_{int(asyncio.get_event_loop().time())}",
-             f"batch2_{int(asyncio.get_event_loop().time())}@example.com",
-             get_password_hash("test123"), True, False),
+            (f"batch_user_1_{ts}", f"batch1_{ts}@example.com",
+             batch_password_hash, True, False),
+            (f"batch_user_2_{ts}", f"batch2_{ts}@example.com",
+             batch_password_hash, True, False),
         ]
 
-        rows = await execute_many(
+        # 행별 실행 대신 multi-row VALUES로 재작성해 전송 (청크당 왕복 1회)
+        rows = await bulk_insert(
             "INSERT INTO users (username, email, hashed_password, is_active, is_superuser) VALUES (%s, %s, %s, %s, %s)",
             test_users
         )
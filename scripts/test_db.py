@@ -48,19 +48,19 @@ async def insert_sample_data():
                 print("⚠️  이미 사용자 데이터가 있습니다.")
                 return
 
-            insert_query = """
-                           INSERT INTO users (username, email, hashed_password)
-                           VALUES (%s, %s, %s) \
-                           """
-
             sample_users = [
                 ('jsyang', 'jsyang@example.com', 'hashed_pw_1'),
                 ('alice', 'alice@example.com', 'hashed_pw_2'),
                 ('bob', 'bob@example.com', 'hashed_pw_3'),
             ]
 
-            for user in sample_users:
-                await cursor.execute(insert_query, user)
+            # executemany는 pymysql/aiomysql이 INSERT ... VALUES를
+            # multi-row 한 문장으로 자동 재작성하므로 수동 문자열 조립이 필요 없음
+            insert_query = """
+                           INSERT INTO users (username, email, hashed_password)
+                           VALUES (%s, %s, %s) \
+                           """
+            await cursor.executemany(insert_query, sample_users)
 
             await conn.commit()
             print("✅ 샘플 데이터 입력 완료!")
@@ -91,13 +91,16 @@ async def get_all_users():
     if not users:
         print("사용자가 없습니다.")
     else:
+        # 행마다 print를 호출하면 stdout flush가 반복되므로 한 번에 출력
+        lines = []
         for user in users:
-            print(f"ID: {user['id']}")
-            print(f"Username: {user['username']}")
-            print(f"Email: {user['email']}")
-            print(f"Created: {user['created_at']}")
-            print(f"Updated: {user['updated_at']}")
-            print("-" * 60)
+            lines.append(f"ID: {user['id']}")
+            lines.append(f"Username: {user['username']}")
+            lines.append(f"Email: {user['email']}")
+            lines.append(f"Created: {user['created_at']}")
+            lines.append(f"Updated: {user['updated_at']}")
+            lines.append("-" * 60)
+        print("\n".join(lines))
 
     return users
 
@@ -5,69 +5,138 @@ tests/conftest.py
 
 import pytest
 import asyncio
-from typing import Generator, AsyncGenerator
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+import os
+from typing import AsyncGenerator
+from httpx import ASGITransport, AsyncClient
 import aiomysql
 
 from app.main import app
 from app.core.config import settings
 from app.core.security import create_access_token
-from app.db.database import get_db_connection
+from app.services.file_service import FileService
+from app.repositories.file_repository import FileRepository
+from app.repositories.post_attachment_repository import PostAttachmentRepository
+from app.repositories.temp_file_repository import TempFileRepository
 
 
 # ================================================================================
 # Event Loop 설정 (비동기 테스트용)
 # ================================================================================
 
+# 루프 스코프는 pytest.ini의 asyncio_default_*_loop_scope = session이 담당하고,
+# 여기서는 어떤 루프 구현을 쓸지만 정합니다 (pytest-asyncio 1.x 방식).
 @pytest.fixture(scope="session")
-def event_loop():
-    """이벤트 루프 생성 (세션 전체에서 공유)"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """이벤트 루프 정책 (세션 공유 루프 생성에 사용)"""
+    # aiomysql/httpx I/O가 대부분이므로 가능하면 uvloop(libuv) 루프를 사용
+    # (미설치 환경 — 예: Windows CI — 에서는 기본 루프로 동작)
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
 
 
 # ================================================================================
 # 테스트 클라이언트
 # ================================================================================
 
-@pytest.fixture
-def client() -> Generator:
+@pytest.fixture(scope="session")
+async def client(asgi_transport) -> AsyncGenerator:
     """
-    동기 테스트 클라이언트
+    비동기 테스트 클라이언트 (세션 공유 루프에서 1회 생성)
+
+    TestClient는 요청마다 스레드-이벤트루프 브리지를 거치므로
+    ASGI 앱에 직접 디스패치하는 httpx.AsyncClient를 사용합니다.
+    인증은 요청별 Bearer 헤더로만 전달되어 클라이언트에 상태가 남지 않습니다.
 
     사용 예:
-        def test_health(client):
-            response = client.get("/health")
+        async def test_health(client):
+            response = await client.get("/health")
             assert response.status_code == 200
     """
-    with TestClient(app) as test_client:
-        yield test_client
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+        # 루프백 TCP로의 회귀 방지 — 요청은 반드시 ASGI 앱에 직접 디스패치되어야 함
+        assert isinstance(ac._transport, ASGITransport)
+        yield ac
 
 
-@pytest.fixture
-async def async_client() -> AsyncGenerator:
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """테스트 간 앱 상태 초기화 (의존성 오버라이드, 프로세스 로컬 캐시)"""
+    yield
+    app.dependency_overrides.clear()
+
+    from app.core import security
+    from app.services import file_service, post_service, shop_service
+    security._token_cache.clear()
+    file_service._file_cache.clear()
+    post_service._post_cache.clear()
+    post_service._list_cache.clear()
+    post_service._view_buffer.clear()
+    shop_service._shop_code_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
     """
-    비동기 테스트 클라이언트
+    세션 공유 ASGI transport
 
-    사용 예:
-        async def test_async_endpoint(async_client):
-            response = await async_client.get("/api/users/")
-            assert response.status_code == 200
+    app= 단축 표기는 내부적으로 transport를 매번 다시 감싸므로 명시적으로
+    한 번만 생성해 공유합니다 (루프백 TCP 없이 ASGI 앱에 직접 디스패치).
+    앱 예외는 round-trip하지 않고 500 응답으로 받습니다.
     """
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    return ASGITransport(app=app, raise_app_exceptions=False)
 
 
 # ================================================================================
 # 데이터베이스
 # ================================================================================
 
+@pytest.fixture(scope="session")
+async def db_pool():
+    """
+    aiomysql 커넥션 풀 (세션 전체에서 공유)
+
+    테스트마다 TCP + MySQL 핸드셰이크/인증을 반복하지 않도록
+    풀에서 커넥션을 빌려 씁니다.
+    """
+    pool = await aiomysql.create_pool(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        db=settings.DB_NAME,
+        minsize=2,
+        maxsize=10,
+        autocommit=False,
+        pool_recycle=3600,
+        cursorclass=aiomysql.DictCursor
+    )
+    yield pool
+    pool.close()
+    await pool.wait_closed()
+
+
+@pytest.fixture(scope="session")
+def worker_suffix():
+    """
+    xdist 워커별 테스트 데이터 접미사
+
+    pytest -n 으로 병렬 실행하면 모든 워커가 같은 users 테이블을 공유해
+    LIKE '%test%' 정리가 서로의 데이터를 지울 수 있습니다. 앱은 항상
+    실제 users 테이블을 읽으므로 테이블을 복제하는 대신, 이메일/사용자명에
+    워커 이름을 붙여 행 단위로 격리합니다 (API 경로에서도 같은 행이 보임).
+    단일 프로세스 실행이면 빈 문자열입니다.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    return f"_{worker}" if worker else ""
+
+
 @pytest.fixture
-async def db_connection():
+async def db_connection(db_pool):
     """
-    데이터베이스 연결 (테스트용)
+    데이터베이스 연결 (테스트용, 풀에서 대여)
 
     사용 예:
         async def test_user_query(db_connection):
@@ -75,68 +144,115 @@ async def db_connection():
                 await cursor.execute("SELECT * FROM users")
                 result = await cursor.fetchone()
     """
-    conn = await get_db_connection()
+    async with db_pool.acquire() as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+async def registered_test_emails(db_pool, worker_suffix):
+    """
+    세션 동안 생성된 테스트 사용자 이메일 집합
+
+    fixture마다 DELETE + commit을 반복하는 대신, 생성 시 이메일만 등록해 두고
+    세션 종료 시 DELETE 한 문장(커밋 1회)으로 일괄 정리합니다.
+    LIKE 패턴에 워커 접미사를 포함해 다른 워커의 행은 건드리지 않습니다.
+    """
+    emails = set()
+    yield emails
+
+    conditions = ["email LIKE %s"]
+    params = [f"%test{worker_suffix}%"]
+    if emails:
+        conditions.append(f"email IN ({', '.join(['%s'] * len(emails))})")
+        params.extend(emails)
+
+    async with db_pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(
+                f"DELETE FROM users WHERE {' OR '.join(conditions)}",
+                tuple(params)
+            )
+        await conn.commit()
+
+
+@pytest.fixture
+async def rollback_transaction():
+    """
+    테스트 전체를 하나의 트랜잭션으로 감싸고 종료 시 ROLLBACK
+
+    transaction()과 같은 contextvar 공유 연결을 열되 COMMIT 대신
+    ROLLBACK하므로, 테스트 안의 repository/API 호출이 남긴 변경이
+    DB에 커밋되지 않습니다 (테이블 재생성 없는 격리).
+    ASGITransport는 테스트 태스크 안에서 앱을 호출하므로
+    contextvar가 요청 핸들러까지 전파됩니다.
+
+    사용 예:
+        async def test_user_crud_flow(client, rollback_transaction):
+            await client.post("/api/users/", json=...)  # 세션 종료 시 롤백됨
+    """
+    from app.db import database
+
+    conn = await database.get_db_connection()
+    token = database._current_connection.set(conn)
     try:
         yield conn
     finally:
+        database._current_connection.reset(token)
+        await conn.rollback()
         conn.close()
 
 
 @pytest.fixture
-async def clean_database(db_connection):
+async def clean_database(db_connection, registered_test_emails):
     """
-    데이터베이스 초기화 (각 테스트 후 정리)
+    데이터베이스 초기화 (정리는 세션 종료 시 일괄 수행)
 
     사용 예:
         async def test_create_user(clean_database):
             # 테스트 코드
-            pass  # 테스트 후 자동으로 데이터 정리됨
+            pass  # 세션 종료 시 자동으로 데이터 정리됨
     """
-    # 테스트 전 상태 저장
     yield db_connection
 
-    # 테스트 후 정리 (선택적)
-    async with db_connection.cursor() as cursor:
-        # 테스트 데이터 삭제 (선택사항)
-        await cursor.execute("DELETE FROM users WHERE email LIKE '%test%'")
-        await db_connection.commit()
-
 
 # ================================================================================
 # 인증 관련
 # ================================================================================
 
-@pytest.fixture
-def test_user_data():
+@pytest.fixture(scope="session")
+def test_user_data(worker_suffix):
     """
-    테스트용 사용자 데이터
+    테스트용 사용자 데이터 (읽기 전용으로 사용 — 세션 공유)
+
+    이메일/사용자명에 워커 접미사가 붙어 xdist 병렬 실행 시에도
+    워커끼리 같은 행을 두고 경합하지 않습니다.
 
     사용 예:
         def test_create_user(client, test_user_data):
             response = client.post("/api/users/", json=test_user_data)
     """
     return {
-        "email": "test@example.com",
-        "username": "testuser",
+        "email": f"test{worker_suffix}@example.com",
+        "username": f"testuser{worker_suffix}",
         "password": "Test1234!",
         "is_active": True,
         "is_admin": False
     }
 
 
-@pytest.fixture
-def test_admin_data():
+@pytest.fixture(scope="session")
+def test_admin_data(worker_suffix):
     """테스트용 관리자 데이터"""
     return {
-        "email": "admin@example.com",
-        "username": "adminuser",
+        "email": f"admin_test{worker_suffix}@example.com",
+        "username": f"adminuser{worker_suffix}",
         "password": "Admin1234!",
         "is_active": True,
         "is_admin": True
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_token():
     """
     테스트용 일반 사용자 JWT 토큰
@@ -154,7 +270,7 @@ def test_user_token():
     return create_access_token(data=token_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_admin_token():
     """테스트용 관리자 JWT 토큰"""
     token_data = {
@@ -165,7 +281,7 @@ def test_admin_token():
     return create_access_token(data=token_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(test_user_token):
     """
     인증 헤더 (일반 사용자)
@@ -177,7 +293,7 @@ def auth_headers(test_user_token):
     return {"Authorization": f"Bearer {test_user_token}"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def admin_headers(test_admin_token):
     """인증 헤더 (관리자)"""
     return {"Authorization": f"Bearer {test_admin_token}"}
@@ -187,90 +303,97 @@ def admin_headers(test_admin_token):
 # 테스트 사용자 생성 (실제 DB)
 # ================================================================================
 
-@pytest.fixture
-async def created_test_user(db_connection, test_user_data):
+@pytest.fixture(scope="session")
+def password_hash_cache():
+    """
+    평문별 bcrypt 해시 캐시 (세션 전체에서 공유)
+
+    bcrypt는 의도적으로 느린 KDF라 fixture마다 재실행하면
+    DB I/O보다 해싱이 테스트 시간을 지배합니다. 평문당 1회만 해싱합니다.
     """
-    실제 DB에 테스트 사용자 생성
+    return {}
+
+async def _upsert_test_user(db_pool, user_data, password_hash) -> dict:
+    """테스트 사용자 upsert 후 dict 조립 (SELECT 재조회 없이 lastrowid 사용)"""
+    async with db_pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            # id = LAST_INSERT_ID(id)는 UPDATE 경로에서도 lastrowid가 행 id가 되게 하는 관용구
+            await cursor.execute("""
+                                 INSERT INTO users (email, username, password_hash, is_active, is_admin)
+                                 VALUES (%s, %s, %s, %s, %s)
+                                 ON DUPLICATE KEY UPDATE password_hash = VALUES(password_hash),
+                                                         id = LAST_INSERT_ID(id)
+                                 """, (
+                                     user_data["email"],
+                                     user_data["username"],
+                                     password_hash,
+                                     user_data["is_active"],
+                                     user_data["is_admin"]
+                                 ))
+            user = {**user_data, "id": cursor.lastrowid, "password_hash": password_hash}
+        await conn.commit()
+    return user
+
+
+@pytest.fixture(scope="session")
+async def created_test_user(db_pool, test_user_data, registered_test_emails, password_hash_cache):
+    """
+    실제 DB에 테스트 사용자 생성 (세션당 1회)
+
+    upsert라서 반복 실행해도 같은 행을 가리키므로, 테스트마다 해싱 + INSERT
+    왕복을 반복하는 대신 세션 전체가 기본 사용자 한 행을 공유합니다.
+    이 행을 변경하는 테스트는 rollback_transaction으로 감싸야 합니다.
 
     사용 예:
         async def test_user_login(client, created_test_user):
             # created_test_user는 실제 DB에 존재하는 사용자
-            response = client.post("/api/auth/login", json={
+            response = await client.post("/api/auth/login", json={
                 "email": created_test_user["email"],
                 "password": "Test1234!"
             })
     """
     from app.core.security import hash_password
 
-    # 비밀번호 해싱
-    password_hash = hash_password(test_user_data["password"])
-
-    # 사용자 생성
-    async with db_connection.cursor(aiomysql.DictCursor) as cursor:
-        await cursor.execute("""
-                             INSERT INTO users (email, username, password_hash, is_active, is_admin)
-                             VALUES (%s, %s, %s, %s, %s)
-                             """, (
-                                 test_user_data["email"],
-                                 test_user_data["username"],
-                                 password_hash,
-                                 test_user_data["is_active"],
-                                 test_user_data["is_admin"]
-                             ))
-        await db_connection.commit()
-
-        # 생성된 사용자 조회
-        await cursor.execute(
-            "SELECT * FROM users WHERE email = %s",
-            (test_user_data["email"],)
-        )
-        user = await cursor.fetchone()
+    # 비밀번호 해싱 (세션 캐시에 있으면 재사용)
+    password = test_user_data["password"]
+    password_hash = password_hash_cache.get(password)
+    if password_hash is None:
+        password_hash = password_hash_cache[password] = hash_password(password)
 
-    yield user
+    user = await _upsert_test_user(db_pool, test_user_data, password_hash)
 
-    # 테스트 후 삭제
-    async with db_connection.cursor() as cursor:
-        await cursor.execute(
-            "DELETE FROM users WHERE email = %s",
-            (test_user_data["email"],)
-        )
-        await db_connection.commit()
+    # 개별 DELETE 대신 세션 종료 일괄 정리에 등록
+    registered_test_emails.add(test_user_data["email"])
 
+    yield user
 
-@pytest.fixture
-async def created_test_admin(db_connection, test_admin_data):
-    """실제 DB에 테스트 관리자 생성"""
+
+@pytest.fixture(scope="session")
+async def created_test_admin(db_pool, test_admin_data, registered_test_emails, password_hash_cache):
+    """실제 DB에 테스트 관리자 생성 (세션당 1회)"""
     from app.core.security import hash_password
 
-    password_hash = hash_password(test_admin_data["password"])
-
-    async with db_connection.cursor(aiomysql.DictCursor) as cursor:
-        await cursor.execute("""
-                             INSERT INTO users (email, username, password_hash, is_active, is_admin)
-                             VALUES (%s, %s, %s, %s, %s)
-                             """, (
-                                 test_admin_data["email"],
-                                 test_admin_data["username"],
-                                 password_hash,
-                                 test_admin_data["is_active"],
-                                 test_admin_data["is_admin"]
-                             ))
-        await db_connection.commit()
-
-        await cursor.execute(
-            "SELECT * FROM users WHERE email = %s",
-            (test_admin_data["email"],)
-        )
-        admin = await cursor.fetchone()
+    password = test_admin_data["password"]
+    password_hash = password_hash_cache.get(password)
+    if password_hash is None:
+        password_hash = password_hash_cache[password] = hash_password(password)
+
+    admin = await _upsert_test_user(db_pool, test_admin_data, password_hash)
+
+    registered_test_emails.add(test_admin_data["email"])
 
     yield admin
 
-    async with db_connection.cursor() as cursor:
-        await cursor.execute(
-            "DELETE FROM users WHERE email = %s",
-            (test_admin_data["email"],)
-        )
-        await db_connection.commit()
+
+@pytest.fixture
+def created_user_id(created_test_user) -> int:
+    """
+    실제 DB에 존재하는 테스트 사용자의 id
+
+    하드코딩된 user_id = 1 대신 주입해서 사용합니다 — 행 존재가 보장되므로
+    '200 또는 404' 같은 비결정적 단언 대신 정확한 상태 코드를 검증할 수 있습니다.
+    """
+    return created_test_user["id"]
 
 
 # ================================================================================
@@ -305,7 +428,7 @@ def mock_users_list():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_token():
     """유효하지 않은 토큰"""
     return "invalid.jwt.token"
@@ -324,12 +447,58 @@ def expired_token():
     return create_access_token(data=token_data, expires_delta=timedelta(days=-1))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    세션 동안 bcrypt를 빠른 해시 스텁으로 대체 (TESTING=1일 때만)
+
+    bcrypt는 의도적으로 호출당 ~100ms가 걸리는 KDF라서, 사용자 생성이
+    많은 테스트에서는 해싱이 전체 실행 시간을 지배합니다. 로그인 경로의
+    로직(해시-검증 일치 여부)은 스텁으로도 동일하게 검증됩니다.
+
+    서비스 모듈들이 함수를 `from ... import`로 가져가므로
+    각 모듈의 바인딩을 함께 교체하고 종료 시 복원합니다.
+    """
+    if os.getenv("TESTING") != "1":
+        yield
+        return
+
+    import hashlib
+    from app.core import security
+    from app.services import auth_service, comment_service, post_service, user_service
+
+    def _fast_hash(password: str) -> str:
+        return "x$fixed$" + hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    def _fast_verify(plain_password: str, hashed_password: str) -> bool:
+        return _fast_hash(plain_password) == hashed_password
+
+    targets = [
+        (security, "hash_password", _fast_hash),
+        (security, "verify_password", _fast_verify),
+        (user_service, "hash_password", _fast_hash),
+        (auth_service, "verify_password", _fast_verify),
+        (comment_service, "hash_password", _fast_hash),
+        (comment_service, "verify_password", _fast_verify),
+        (post_service, "hash_password", _fast_hash),
+        (post_service, "verify_password", _fast_verify),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in targets]
+    for module, name, stub in targets:
+        setattr(module, name, stub)
+
+    yield
+
+    for module, name, original in originals:
+        setattr(module, name, original)
+
+
 # ================================================================================
 # 환경 설정
 # ================================================================================
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+def setup_test_environment(pytestconfig):
     """
     테스트 환경 설정 (세션 시작 시 자동 실행)
     """
@@ -337,23 +506,38 @@ def setup_test_environment():
     import os
     os.environ["ENVIRONMENT"] = "test"
 
-    print("\n" + "="*60)
-    print("🧪 테스트 환경 설정 완료")
-    print(f"   환경: {settings.ENVIRONMENT}")
-    print(f"   DB: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
-    print("="*60 + "\n")
+    # 배너 출력은 -v 이상에서만 (pytest 캡처 하의 stdout flush 비용 절약)
+    verbose = pytestconfig.getoption("verbose") > 0
+    if verbose:
+        print("\n" + "="*60)
+        print("🧪 테스트 환경 설정 완료")
+        print(f"   환경: {settings.ENVIRONMENT}")
+        print(f"   DB: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+        print("="*60 + "\n")
 
     yield
 
-    print("\n" + "="*60)
-    print("✅ 테스트 완료")
-    print("="*60 + "\n")
+    if verbose:
+        print("\n" + "="*60)
+        print("✅ 테스트 완료")
+        print("="*60 + "\n")
 
 
 # ================================================================================
 # 유틸리티 함수
 # ================================================================================
 
+@pytest.fixture(scope="class")
+def file_service():
+    """
+    FileService 인스턴스 (클래스 단위로 1회 구성)
+
+    repository들과 service는 테스트별 상태가 없는 순수 객체 그래프이므로
+    메서드마다 4개 생성자를 다시 호출할 필요가 없습니다.
+    """
+    return FileService(FileRepository(), PostAttachmentRepository(), TempFileRepository())
+
+
 @pytest.fixture
 def assert_valid_response():
     """
@@ -399,27 +583,46 @@ def compare_dict():
 # ================================================================================
 
 @pytest.fixture
-def benchmark_timer():
+def async_benchmark():
     """
-    성능 측정 헬퍼
+    비동기 벤치마크 헬퍼 (워밍업 + 반복 측정 + 백분위)
+
+    1회 wall time만 찍던 타이머와 달리 워밍업으로 콜드스타트를 제외하고
+    여러 라운드의 mean/p50/p95를 돌려주므로 회귀를 수치로 잡을 수 있습니다.
 
     사용 예:
-        def test_performance(benchmark_timer):
-            with benchmark_timer("API 호출"):
-                # 성능 측정할 코드
-                pass
+        async def test_performance(client, async_benchmark):
+            result = await async_benchmark(lambda: client.get("/api/users/"))
+            assert result["p95"] < 0.1
     """
     import time
-    from contextlib import contextmanager
 
-    @contextmanager
-    def _timer(name: str = "Operation"):
-        start = time.time()
-        yield
-        elapsed = time.time() - start
-        print(f"\n⏱️  {name}: {elapsed:.3f}초")
+    async def _benchmark(fn, *, warmup: int = 1, rounds: int = 5):
+        result = None
+        for _ in range(warmup):
+            result = await fn()
+
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = await fn()
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+
+        def _percentile(p: float) -> float:
+            return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+        return {
+            "rounds": rounds,
+            "mean": sum(samples) / len(samples),
+            "min": samples[0],
+            "max": samples[-1],
+            "p50": _percentile(0.50),
+            "p95": _percentile(0.95),
+            "last_result": result,
+        }
 
-    return _timer
+    return _benchmark
 
 
 # ================================================================================
@@ -431,12 +634,15 @@ def configure_test_logging():
     """테스트용 로깅 설정"""
     import logging
 
-    # 테스트 중 로그 레벨 조정
+    # 테스트 중 로그 레벨 조정 + INFO 이하 전역 비활성화
+    # (핸들러 포매팅/emit 비용을 테스트 경로에서 제거)
     logging.getLogger("fastapi_app").setLevel(logging.WARNING)
+    logging.disable(logging.INFO)
 
     yield
 
-    # 원래 레벨로 복구
+    # 원래 상태로 복구
+    logging.disable(logging.NOTSET)
     logging.getLogger("fastapi_app").setLevel(logging.INFO)
 
 
@@ -2,6 +2,7 @@
 수동 보안 테스트
 Manual security test without pytest
 """
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,60 +15,38 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.post_repository import PostRepository
 from app.repositories.comment_repository import CommentRepository
 
+# 테스트 함수마다 service/repository를 다시 만들 필요가 없으므로 모듈 로드 시 1회 구성
+_FILE_SERVICE = FileService(FileRepository(), PostAttachmentRepository(), TempFileRepository())
+
+
+# (repository 클래스, 악성 필드) 케이스 — update의 필드 화이트리스트 검증은
+# DB 접근 전에 수행되므로 실제 연결 없이도 가드를 실행할 수 있습니다
+_INJECTION_CASES = [
+    (UserRepository, {"email; DROP TABLE users; --": "attacker@evil.com"}),
+    (PostRepository, {"title; DELETE FROM posts; --": "Hacked"}),
+    (CommentRepository, {"author_id; UPDATE users SET is_admin=1; --": 999}),
+]
+
 
 def test_sql_injection_prevention():
     """SQL 인젝션 방지 테스트"""
     print("\n🔒 SQL Injection Prevention Tests")
     print("=" * 60)
 
-    # User Repository 테스트
-    print("\n[TEST 1] User Repository - Malicious field injection")
-    try:
-        repo = UserRepository()
-        malicious_fields = {
-            "email; DROP TABLE users; --": "attacker@evil.com"
-        }
-        # 이 코드는 실행되지 않아야 함 (ValueError 발생)
-        print("❌ FAILED: SQL injection was NOT blocked!")
-    except ValueError as e:
-        if "허용되지 않은 필드" in str(e):
-            print(f"✅ PASSED: {e}")
-        else:
-            print(f"❌ FAILED: Wrong error message: {e}")
-    except Exception as e:
-        print(f"❌ FAILED: Unexpected error: {e}")
-
-    # Post Repository 테스트
-    print("\n[TEST 2] Post Repository - Malicious field injection")
-    try:
-        repo = PostRepository()
-        malicious_fields = {
-            "title; DELETE FROM posts; --": "Hacked"
-        }
-        print("❌ FAILED: SQL injection was NOT blocked!")
-    except ValueError as e:
-        if "허용되지 않은 필드" in str(e):
-            print(f"✅ PASSED: {e}")
-        else:
-            print(f"❌ FAILED: Wrong error message: {e}")
-    except Exception as e:
-        print(f"❌ FAILED: Unexpected error: {e}")
-
-    # Comment Repository 테스트
-    print("\n[TEST 3] Comment Repository - Malicious field injection")
-    try:
-        repo = CommentRepository()
-        malicious_fields = {
-            "author_id; UPDATE users SET is_admin=1; --": 999
-        }
-        print("❌ FAILED: SQL injection was NOT blocked!")
-    except ValueError as e:
-        if "허용되지 않은 필드" in str(e):
-            print(f"✅ PASSED: {e}")
-        else:
-            print(f"❌ FAILED: Wrong error message: {e}")
-    except Exception as e:
-        print(f"❌ FAILED: Unexpected error: {e}")
+    for test_no, (repo_class, malicious_fields) in enumerate(_INJECTION_CASES, 1):
+        print(f"\n[TEST {test_no}] {repo_class.__name__} - Malicious field injection")
+        try:
+            repo = repo_class()
+            # 가드가 실제로 실행되도록 update를 호출 (ValueError 발생해야 함)
+            asyncio.run(repo.update(1, **malicious_fields))
+            print("❌ FAILED: SQL injection was NOT blocked!")
+        except ValueError as e:
+            if "허용되지 않은 필드" in str(e):
+                print(f"✅ PASSED: {e}")
+            else:
+                print(f"❌ FAILED: Wrong error message: {e}")
+        except Exception as e:
+            print(f"❌ FAILED: Unexpected error: {e}")
 
 
 def test_path_traversal_prevention():
@@ -75,10 +54,7 @@ def test_path_traversal_prevention():
     print("\n\n🔒 Path Traversal Prevention Tests")
     print("=" * 60)
 
-    file_repo = FileRepository()
-    attachment_repo = PostAttachmentRepository()
-    temp_repo = TempFileRepository()
-    service = FileService(file_repo, attachment_repo, temp_repo)
+    service = _FILE_SERVICE
 
     # 테스트 1: .. 포함
     print("\n[TEST 4] Path Traversal - Double dot attack")
@@ -122,10 +98,7 @@ def test_mime_spoofing_prevention():
     print("\n\n🔒 MIME Spoofing Prevention Tests")
     print("=" * 60)
 
-    file_repo = FileRepository()
-    attachment_repo = PostAttachmentRepository()
-    temp_repo = TempFileRepository()
-    service = FileService(file_repo, attachment_repo, temp_repo)
+    service = _FILE_SERVICE
 
     # 테스트 1: JPEG Magic bytes
     print("\n[TEST 7] Magic Bytes - Valid JPEG")